@@ -19,8 +19,26 @@ import uuid
 
 from task_manager import Task, TaskType, TaskStatus, TaskPriority
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def json_dumps(obj: Any) -> str:
+    """Serialize a tool payload to a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def json_loads(data: str) -> Any:
+    """Parse a JSON tool argument, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 @dataclass
 class AgentMetrics:
     agent_id: str
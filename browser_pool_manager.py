@@ -258,27 +258,41 @@ class BrowserPoolManager:
             logger.error(f"❌ Error closing browser {browser_id[:8]}: {e}")
 
     @asynccontextmanager
-    async def get_page(self, url: str, domain_restrictions: Optional[Set[str]] = None):
-        """Get a page from the browser pool with automatic cleanup"""
-        browser_id = None
+    async def get_page(self, url: str, domain_restrictions: Optional[Set[str]] = None,
+                       browser_id: Optional[str] = None):
+        """Get a page from the browser pool with automatic cleanup
+        
+        Pass the browser_id of a browser reserved with acquire_browser to open the
+        page in its warm context; that browser is then not returned to the pool.
+        Pages in a reserved browser are still capped at its max_pages, so callers
+        wait for a free page slot.
+        """
+        reserved = browser_id is not None
         page = None
+        slot_claimed = False
         
         try:
             # Apply rate limiting
-            await self._apply_rate_limiting(url)
+            await self.apply_rate_limiting(url)
             
             # Get available browser
-            browser_id = await self._get_available_browser(domain_restrictions)
+            if not reserved:
+                browser_id = await self._get_available_browser(domain_restrictions)
+            elif browser_id not in self.browsers:
+                raise RuntimeError(f"Reserved browser {browser_id[:8]} is no longer in the pool")
+            else:
+                await self._wait_for_page_slot(browser_id)
             browser_instance = self.browsers[browser_id]
             
-            # Create new page
-            page = await browser_instance.context.new_page()
-            page.set_default_timeout(self.request_timeout)
-            
-            # Update metrics
+            # Claim the page slot before creating the page so concurrent callers see it
             browser_instance.active_pages += 1
             browser_instance.last_used = datetime.now()
             self.metrics.active_pages += 1
+            slot_claimed = True
+            
+            # Create new page
+            page = await browser_instance.context.new_page()
+            page.set_default_timeout(self.request_timeout)
             
             logger.debug(f"📄 Created page for {url} using browser {browser_id[:8]}")
             
@@ -290,19 +304,45 @@ class BrowserPoolManager:
             
         finally:
             # Cleanup page
-            if page:
-                try:
+            try:
+                if page:
                     await page.close()
-                    if browser_id and browser_id in self.browsers:
-                        self.browsers[browser_id].active_pages -= 1
-                        self.metrics.active_pages -= 1
-                        
-                        # Return browser to pool if healthy
-                        if self.browsers[browser_id].is_healthy:
-                            await self.available_browsers.put(browser_id)
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error closing page: {e}")
+                if slot_claimed and browser_id in self.browsers:
+                    self.browsers[browser_id].active_pages -= 1
+                    self.metrics.active_pages -= 1
+                    
+                    # Return browser to pool if healthy
+                    if not reserved and self.browsers[browser_id].is_healthy:
+                        await self.available_browsers.put(browser_id)
+                    
+            except Exception as e:
+                logger.error(f"❌ Error closing page: {e}")
+
+    async def acquire_browser(self, domain_restrictions: Optional[Set[str]] = None) -> str:
+        """Reserve a browser for a caller that opens many pages in its context; pair with release_browser"""
+        browser_id = await self._get_available_browser(domain_restrictions)
+        logger.debug(f"🔒 Reserved browser {browser_id[:8]}")
+        return browser_id
+
+    async def release_browser(self, browser_id: str):
+        """Return a browser reserved with acquire_browser to the pool"""
+        if browser_id in self.browsers and self.browsers[browser_id].is_healthy:
+            await self.available_browsers.put(browser_id)
+            logger.debug(f"🔓 Released browser {browser_id[:8]}")
+
+    async def _wait_for_page_slot(self, browser_id: str, timeout: float = 30):
+        """Wait until a reserved browser has fewer than max_pages open pages"""
+        start_time = time.time()
+        
+        while True:
+            browser_instance = self.browsers.get(browser_id)
+            if browser_instance is None:
+                raise RuntimeError(f"Reserved browser {browser_id[:8]} is no longer in the pool")
+            if browser_instance.active_pages < browser_instance.max_pages:
+                return
+            if time.time() - start_time >= timeout:
+                raise RuntimeError(f"Timeout waiting for a free page in browser {browser_id[:8]}")
+            await asyncio.sleep(0.1)
 
     async def _get_available_browser(self, domain_restrictions: Optional[Set[str]] = None) -> str:
         """Get an available browser from the pool"""
@@ -346,8 +386,12 @@ class BrowserPoolManager:
         
         raise RuntimeError("Timeout waiting for available browser")
 
-    async def _apply_rate_limiting(self, url: str):
-        """Apply rate limiting based on domain"""
+    async def apply_rate_limiting(self, url: str):
+        """Apply rate limiting based on domain
+
+        Pooled pages take their slot in get_page; callers fetching a URL outside
+        the pool await this first so they draw on the same per-domain budget.
+        """
         from urllib.parse import urlparse
         
         try:
@@ -360,16 +404,18 @@ class BrowserPoolManager:
                     delay = domain_delay
                     break
             
-            # Check if we need to wait
+            # Reserve the next free slot before waiting, so concurrent callers are
+            # spaced out instead of all waking after the same delay
+            now = datetime.now()
+            slot = now
             if domain in self.domain_last_request:
-                elapsed = (datetime.now() - self.domain_last_request[domain]).total_seconds()
-                if elapsed < delay:
-                    wait_time = delay - elapsed
-                    logger.debug(f"⏱️ Rate limiting {domain}: waiting {wait_time:.1f}s")
-                    await asyncio.sleep(wait_time)
+                slot = max(now, self.domain_last_request[domain] + timedelta(seconds=delay))
+            self.domain_last_request[domain] = slot
             
-            # Update last request time
-            self.domain_last_request[domain] = datetime.now()
+            wait_time = (slot - now).total_seconds()
+            if wait_time > 0:
+                logger.debug(f"⏱️ Rate limiting {domain}: waiting {wait_time:.1f}s")
+                await asyncio.sleep(wait_time)
             
         except Exception as e:
             logger.warning(f"Rate limiting error for {url}: {e}")
@@ -379,55 +425,102 @@ class BrowserPoolManager:
                                 scroll_to_bottom: bool = False,
                                 screenshot: bool = False) -> Dict[str, Any]:
         """Fetch page content with optional waiting and actions"""
-        start_time = time.time()
-        
         try:
             async with self.get_page(url) as page:
-                # Navigate to page
-                response = await page.goto(url, wait_until='domcontentloaded')
-                
-                # Wait for specific selector if provided
-                if wait_for_selector:
-                    await page.wait_for_selector(wait_for_selector, timeout=10000)
-                
-                # Scroll to bottom if requested
-                if scroll_to_bottom:
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await asyncio.sleep(1)
-                
-                # Get page content
-                content = await page.content()
-                title = await page.title()
-                
-                # Take screenshot if requested
-                screenshot_data = None
-                if screenshot:
-                    screenshot_data = await page.screenshot(type='png')
-                
-                # Update metrics
-                duration = time.time() - start_time
-                self.metrics.total_requests += 1
-                self.metrics.successful_requests += 1
-                self._update_response_time(duration)
-                
-                return {
-                    'url': url,
-                    'content': content,
-                    'title': title,
-                    'status_code': response.status if response else None,
-                    'response_time': duration,
-                    'screenshot': screenshot_data,
-                    'timestamp': datetime.now().isoformat()
-                }
+                return await self._fetch_on_page(page, url, wait_for_selector, scroll_to_bottom, screenshot)
                 
         except Exception as e:
-            # Update failure metrics
-            self.metrics.total_requests += 1
-            self.metrics.failed_requests += 1
-            
-            logger.error(f"❌ Failed to fetch {url}: {e}")
+            self._record_fetch_failure(url, e)
             raise
 
+    async def fetch_batch_content(self, urls: List[str],
+                                  wait_for_selector: Optional[str] = None,
+                                  max_pages: Optional[int] = None) -> List[Any]:
+        """Fetch several URLs on up to max_pages concurrent pooled pages, each reused for its share of the batch.
+
+        max_pages defaults to max_pages_per_browser. Returns one entry per URL in
+        input order: the content dict on success, or the exception raised for that URL.
+        """
+        if not urls:
+            return []
+
+        page_count = min(len(urls), max_pages or self.max_pages_per_browser)
+        results: List[Any] = [None] * len(urls)
+
+        async def fetch_share(indices: List[int]):
+            try:
+                async with self.get_page(urls[indices[0]]) as page:
+                    for position, index in enumerate(indices):
+                        try:
+                            # get_page already rate limited the first URL
+                            if position > 0:
+                                await self.apply_rate_limiting(urls[index])
+                            results[index] = await self._fetch_on_page(page, urls[index], wait_for_selector)
+                        except Exception as e:
+                            results[index] = self._record_fetch_failure(urls[index], e)
+            except Exception as e:
+                # Page acquisition failed - every URL of this share not yet fetched fails with it
+                for index in indices:
+                    if results[index] is None:
+                        results[index] = self._record_fetch_failure(urls[index], e)
+
+        # Deal URLs round-robin so every page gets an even share
+        await asyncio.gather(*(fetch_share(list(range(start, len(urls), page_count)))
+                               for start in range(page_count)))
+        return results
+
+    async def _fetch_on_page(self, page: Page, url: str,
+                             wait_for_selector: Optional[str] = None,
+                             scroll_to_bottom: bool = False,
+                             screenshot: bool = False) -> Dict[str, Any]:
+        """Navigate an open page to url and return its content dict"""
+        start_time = time.time()
+        
+        # Navigate to page
+        response = await page.goto(url, wait_until='domcontentloaded')
+        
+        # Wait for specific selector if provided
+        if wait_for_selector:
+            await page.wait_for_selector(wait_for_selector, timeout=10000)
+        
+        # Scroll to bottom if requested
+        if scroll_to_bottom:
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await asyncio.sleep(1)
+        
+        # Get page content
+        content = await page.content()
+        title = await page.title()
+        
+        # Take screenshot if requested
+        screenshot_data = None
+        if screenshot:
+            screenshot_data = await page.screenshot(type='png')
+        
+        # Update metrics
+        duration = time.time() - start_time
+        self.metrics.total_requests += 1
+        self.metrics.successful_requests += 1
+        self._update_response_time(duration)
+        
+        return {
+            'url': url,
+            'content': content,
+            'title': title,
+            'status_code': response.status if response else None,
+            'response_time': duration,
+            'screenshot': screenshot_data,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def _record_fetch_failure(self, url: str, error: Exception) -> Exception:
+        """Count and log a failed fetch, returning the error for batch results"""
+        self.metrics.total_requests += 1
+        self.metrics.failed_requests += 1
+        
+        logger.error(f"❌ Failed to fetch {url}: {error}")
+        return error
+
     def _update_response_time(self, duration: float):
         """Update average response time metric"""
         if self.metrics.successful_requests == 1:
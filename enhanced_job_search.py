@@ -4,7 +4,10 @@ Enhanced Drupal Job Search with Email and Slack Notifications
 """
 
 import smtplib
+import threading
+import time
 import requests
+from queue import Queue, Empty
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from drupal_job_search import DrupalJobSearchCrew
@@ -19,6 +22,13 @@ class NotificationManager:
         self.email_password = os.getenv('EMAIL_PASSWORD')
         self.notification_email = os.getenv('NOTIFICATION_EMAIL')
         self.slack_webhook = os.getenv('SLACK_WEBHOOK_URL')
+        
+        # Slack deliveries are queued and drained by a background worker so callers never wait on the network
+        self.slack_max_retries = 3
+        self._slack_queue = Queue()
+        self._slack_worker = None
+        self._slack_lock = threading.Lock()
+        self._slack_session = requests.Session()
     
     def send_email_notification(self, report_content, job_count):
         """Send email notification with job report"""
@@ -54,35 +64,70 @@ class NotificationManager:
             print("Slack webhook not configured, skipping Slack notification")
             return
         
-        try:
-            payload = {
-                "text": f"🔍 Daily Drupal Jobs Report",
-                "attachments": [
-                    {
-                        "color": "good" if job_count > 0 else "warning",
-                        "fields": [
-                            {
-                                "title": "New Opportunities Found",
-                                "value": str(job_count),
-                                "short": True
-                            },
-                            {
-                                "title": "Date",
-                                "value": datetime.now().strftime("%Y-%m-%d"),
-                                "short": True
-                            }
-                        ],
-                        "text": report_summary[:500] + "..." if len(report_summary) > 500 else report_summary
-                    }
-                ]
-            }
-            
-            response = requests.post(self.slack_webhook, json=payload)
-            response.raise_for_status()
-            print("Slack notification sent successfully")
+        payload = {
+            "text": f"🔍 Daily Drupal Jobs Report",
+            "attachments": [
+                {
+                    "color": "good" if job_count > 0 else "warning",
+                    "fields": [
+                        {
+                            "title": "New Opportunities Found",
+                            "value": str(job_count),
+                            "short": True
+                        },
+                        {
+                            "title": "Date",
+                            "value": datetime.now().strftime("%Y-%m-%d"),
+                            "short": True
+                        }
+                    ],
+                    "text": report_summary[:500] + "..." if len(report_summary) > 500 else report_summary
+                }
+            ]
+        }
+        
+        self._enqueue_slack_payload(payload)
+    
+    def send_slack_message(self, text):
+        """Queue a plain-text Slack message"""
+        if not self.slack_webhook:
+            return
+        
+        self._enqueue_slack_payload({"text": text})
+    
+    def _enqueue_slack_payload(self, payload):
+        """Queue a Slack payload without blocking and make sure a worker is draining the queue"""
+        self._slack_queue.put_nowait((payload, 0))
+        
+        with self._slack_lock:
+            if self._slack_worker is None:
+                # Non-daemon so queued notifications are still delivered when the caller exits
+                self._slack_worker = threading.Thread(target=self._drain_slack_queue, name="slack-notifier")
+                self._slack_worker.start()
+    
+    def _drain_slack_queue(self):
+        """Background worker that posts queued Slack payloads, retrying failures with backoff"""
+        while True:
+            try:
+                payload, attempt = self._slack_queue.get(timeout=1.0)
+            except Empty:
+                with self._slack_lock:
+                    if self._slack_queue.empty():
+                        self._slack_worker = None
+                        return
+                continue
             
-        except Exception as e:
-            print(f"Failed to send Slack notification: {e}")
+            try:
+                response = self._slack_session.post(self.slack_webhook, json=payload, timeout=10)
+                response.raise_for_status()
+                print("Slack notification sent successfully")
+                
+            except Exception as e:
+                if attempt < self.slack_max_retries:
+                    time.sleep(2 ** attempt)
+                    self._slack_queue.put_nowait((payload, attempt + 1))
+                else:
+                    print(f"Failed to send Slack notification: {e}")
     
     def markdown_to_html(self, markdown_content):
         """Convert markdown to basic HTML for email"""
@@ -124,9 +169,7 @@ class EnhancedDrupalJobSearch(DrupalJobSearchCrew):
         except Exception as e:
             # Send error notification
             error_msg = f"❌ Drupal job search failed: {str(e)}"
-            if self.notification_manager.slack_webhook:
-                requests.post(self.notification_manager.slack_webhook, 
-                            json={"text": error_msg})
+            self.notification_manager.send_slack_message(error_msg)
             raise
     
     def extract_job_count(self, report_content):
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Extraction Cache - Persistent store of validated job extraction results
+Part of the asynchronous multi-agent job search system
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+from async_agent_base import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+class ExtractionCache:
+    """SQLite-backed cache of validated job data keyed by the platform's job ID
+
+    Entries older than ttl_seconds are treated as missing. The database file and
+    its directory are created on first use, and each call opens its own short-lived
+    connection so the cache can be used from worker threads.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float = 86400):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the cache table on first use"""
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=5)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS extraction_cache (
+                    job_id TEXT PRIMARY KEY,
+                    extracted_at REAL NOT NULL,
+                    data TEXT NOT NULL
+                )
+            """)
+            connection.commit()
+            self._initialized = True
+        return connection
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached job data for job_id, or None if missing or expired"""
+        if not job_id:
+            return None
+
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT extracted_at, data FROM extraction_cache WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        finally:
+            connection.close()
+
+        if row is None or time.time() - row[0] >= self.ttl_seconds:
+            return None
+        return json_loads(row[1])
+
+    def put(self, job_id: str, data: Dict[str, Any]):
+        """Store job data for job_id, replacing any earlier entry"""
+        if not job_id:
+            return
+
+        connection = self._connect()
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO extraction_cache (job_id, extracted_at, data) VALUES (?, ?, ?)",
+                (job_id, time.time(), json_dumps(data))
+            )
+            connection.commit()
+        finally:
+            connection.close()
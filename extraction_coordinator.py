@@ -5,9 +5,13 @@ Part of the asynchronous multi-agent job search system
 """
 
 import asyncio
+import functools
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import sys
+from collections import deque
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Set, Deque
 from datetime import datetime
 from dataclasses import dataclass, field
 from urllib.parse import urlparse
@@ -20,6 +24,11 @@ from async_agent_base import ExtractionAgentBase
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Lower-cased network location of a URL, cached since each URL is inspected several times"""
+    return urlparse(url).netloc.lower()
+
 @dataclass
 class ExtractionCoordinatorMetrics:
     total_extractions: int = 0
@@ -28,26 +37,122 @@ class ExtractionCoordinatorMetrics:
     total_jobs_extracted: int = 0
     platform_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     avg_extraction_time: float = 0.0
+    total_extraction_time: float = 0.0
+    recent_durations: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
     last_extraction: Optional[datetime] = None
 
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * pct / 100), len(sorted_values) - 1)
+    return sorted_values[index]
+
+class AsyncBatcher:
+    """Collects items submitted concurrently and hands them to a batch processor in groups"""
+
+    def __init__(self,
+                 process_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_batch_size: int = 8,
+                 max_queue_time: float = 0.2):
+
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+    async def process(self, item: Any) -> Any:
+        """Queue an item and wait for its result from the batch it lands in"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_queue_time, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Dispatch everything queued so far as a single batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        batch_task = asyncio.create_task(self._run_batch(batch))
+        self._batch_tasks.add(batch_task)
+        batch_task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[tuple]):
+        """Run the batch processor and resolve each item's future"""
+        try:
+            results = await self.process_batch([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+class URLBatcher(AsyncBatcher):
+    """Batches page fetches so each pooled page serves up to urls_per_page URLs of the same platform
+
+    The pages of a batch load concurrently; the URLs sharing a page load one
+    after another, saving a page setup for every URL after the first.
+    """
+
+    def __init__(self, browser_pool: BrowserPoolManager,
+                 max_batch_size: int = 8,
+                 max_queue_time: float = 0.2,
+                 urls_per_page: int = 2):
+        self.browser_pool = browser_pool
+        self.urls_per_page = urls_per_page
+        super().__init__(
+            process_batch=self._fetch_batch,
+            max_batch_size=max_batch_size,
+            max_queue_time=max_queue_time
+        )
+
+    async def _fetch_batch(self, urls: List[str]) -> List[Any]:
+        """Fetch a batch on just enough pages to give each its share of URLs"""
+        page_count = -(-len(urls) // self.urls_per_page)
+        return await self.browser_pool.fetch_batch_content(urls, max_pages=page_count)
+
 class ExtractionCoordinator:
     """Coordinates job data extraction across multiple specialized extraction agents"""
     
     def __init__(self, 
                  browser_pool: Optional[BrowserPoolManager] = None,
-                 max_concurrent_extractions: int = 5):
+                 max_concurrent_extractions: int = 5,
+                 cache_dir: Optional[str] = 'extraction_cache',
+                 cache_ttl: float = 3600):
         
         self.browser_pool = browser_pool or BrowserPoolManager(max_browsers=8, max_pages_per_browser=3)
         self.max_concurrent_extractions = max_concurrent_extractions
         self.task_manager = TaskManager()
         
-        # Initialize extraction agents
-        self.extraction_agents = {
-            'linkedin': LinkedInExtractionAgent(browser_pool=self.browser_pool),
-            'indeed': IndeedExtractionAgent(browser_pool=self.browser_pool),
-            'dice': self._create_generic_extraction_agent('dice'),
-            'freelance': self._create_generic_extraction_agent('freelance'),
-            'generic': self._create_generic_extraction_agent('generic')
+        # Completed LinkedIn extractions are cached so a retried task or re-run batch
+        # skips jobs it already extracted; the TTL keeps the next daily run fresh
+        linkedin_cache_path = os.path.join(cache_dir, 'linkedin_extraction_cache.db') if cache_dir else None
+        
+        # Initialize specialized extraction agents; generic ones are created on first use
+        self.supported_platforms = ('linkedin', 'indeed', 'dice', 'freelance', 'generic')
+        self.extraction_agents: Dict[str, ExtractionAgentBase] = {
+            'linkedin': LinkedInExtractionAgent(browser_pool=self.browser_pool,
+                                                cache_path=linkedin_cache_path, cache_ttl=cache_ttl),
+            'indeed': IndeedExtractionAgent(browser_pool=self.browser_pool)
         }
         
         self.metrics = ExtractionCoordinatorMetrics()
@@ -56,6 +161,12 @@ class ExtractionCoordinator:
         # Semaphore to limit concurrent extractions
         self.extraction_semaphore = asyncio.Semaphore(max_concurrent_extractions)
         
+        # Short-lived status snapshot so frequent polling doesn't re-walk every agent
+        self.status_cache_ttl = 0.5
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_cache_time = 0.0
+        self._status_lock = asyncio.Lock()
+        
         logger.info(f"🎯 Extraction Coordinator initialized with {len(self.extraction_agents)} agents")
 
     def _create_generic_extraction_agent(self, platform: str) -> ExtractionAgentBase:
@@ -70,6 +181,12 @@ class ExtractionCoordinator:
                     max_concurrent_tasks=3
                 )
                 self.browser_pool = browser_pool
+                # execute_task never runs more than max_concurrent_tasks at once, so a
+                # batch that size flushes as soon as every active task has queued its URL,
+                # and its URLs share pages two at a time
+                self.url_batcher = (
+                    URLBatcher(browser_pool, max_batch_size=self.max_concurrent_tasks) if browser_pool else None
+                )
             
             def get_supported_task_types(self) -> List[TaskType]:
                 return [TaskType.EXTRACT_GENERIC]
@@ -78,9 +195,9 @@ class ExtractionCoordinator:
                 url = task.data.get('url', '')
                 
                 try:
-                    # Basic extraction using browser pool
-                    if self.browser_pool:
-                        content = await self.browser_pool.fetch_page_content(url)
+                    # Basic extraction using browser pool, batched with concurrent URLs
+                    if self.url_batcher:
+                        content = await self.url_batcher.process(url)
                         
                         # Basic data extraction
                         job_data = {
@@ -114,6 +231,10 @@ class ExtractionCoordinator:
             def _extract_title_from_content(self, content: str) -> str:
                 """Extract job title from HTML content"""
                 import re
+                
+                # Titles sit near the top of the document; don't regex-scan the whole page
+                content = content[:8192]
+                
                 title_patterns = [
                     r'<title>([^<]+)</title>',
                     r'<h1[^>]*>([^<]+)</h1>',
@@ -130,7 +251,7 @@ class ExtractionCoordinator:
             def _extract_company_from_url(self, url: str) -> str:
                 """Extract company name from URL domain"""
                 try:
-                    domain = urlparse(url).netloc
+                    domain = _netloc(url)
                     company = domain.replace('www.', '').replace('.com', '').replace('.', ' ').title()
                     return company
                 except:
@@ -138,6 +259,17 @@ class ExtractionCoordinator:
         
         return GenericExtractionAgent(platform, self.browser_pool)
 
+    def _get_agent(self, platform: str) -> ExtractionAgentBase:
+        """Get the extraction agent for a platform, creating generic agents on first use"""
+        agent = self.extraction_agents.get(platform)
+        if agent is None:
+            # Creation is synchronous, so concurrent first accesses can't interleave here
+            agent = self._create_generic_extraction_agent(platform)
+            agent.running = self.running
+            self.extraction_agents[platform] = agent
+            logger.info(f"✅ Created {platform} extraction agent: {agent.agent_id}")
+        return agent
+
     async def start(self):
         """Start the extraction coordinator and all agents"""
         self.running = True
@@ -162,6 +294,9 @@ class ExtractionCoordinator:
         # Stop all extraction agents
         for platform, agent in self.extraction_agents.items():
             agent.running = False
+            # Agents holding a reserved browser hand it back before the pool shuts down
+            if hasattr(agent, 'close'):
+                await agent.close()
             logger.info(f"🛑 Stopped {platform} extraction agent: {agent.agent_id}")
         
         # Stop task manager
@@ -174,7 +309,9 @@ class ExtractionCoordinator:
 
     async def extract_jobs(self, urls: List[str]) -> Dict[str, Any]:
         """Extract job data from a list of URLs"""
-        start_time = datetime.now()
+        started_at = datetime.now()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         logger.info(f"🔍 Starting extraction for {len(urls)} URLs")
         
@@ -184,18 +321,19 @@ class ExtractionCoordinator:
         # Create extraction tasks
         extraction_tasks = []
         for platform, platform_urls_list in platform_urls.items():
-            for url in platform_urls_list:
+            for index, url in enumerate(platform_urls_list):
                 task = self._create_extraction_task(platform, url)
-                extraction_tasks.append((platform, task))
+                extraction_tasks.append((platform, index, task))
         
         # Execute extractions with concurrency control
-        results = await self._execute_concurrent_extractions(extraction_tasks)
+        platform_counts = {platform: len(urls_list) for platform, urls_list in platform_urls.items()}
+        results = await self._execute_concurrent_extractions(extraction_tasks, platform_counts)
         
         # Process and aggregate results
         aggregated_results = self._aggregate_extraction_results(results)
         
         # Update metrics
-        extraction_duration = (datetime.now() - start_time).total_seconds()
+        extraction_duration = loop.time() - start_time
         self._update_extraction_metrics(results, extraction_duration)
         
         logger.info(f"✅ Extraction completed in {extraction_duration:.2f}s")
@@ -208,12 +346,12 @@ class ExtractionCoordinator:
             'platform_breakdown': aggregated_results['platform_stats'],
             'extracted_jobs': aggregated_results['jobs'],
             'extraction_summary': aggregated_results['summary'],
-            'timestamp': start_time.isoformat()
+            'timestamp': started_at.isoformat()
         }
 
     def _group_urls_by_platform(self, urls: List[str]) -> Dict[str, List[str]]:
         """Group URLs by their platform"""
-        platform_urls = {platform: [] for platform in self.extraction_agents.keys()}
+        platform_urls = {platform: [] for platform in self.supported_platforms}
         
         for url in urls:
             platform = self._detect_platform_from_url(url)
@@ -225,7 +363,7 @@ class ExtractionCoordinator:
     def _detect_platform_from_url(self, url: str) -> str:
         """Detect platform from URL"""
         try:
-            domain = urlparse(url).netloc.lower()
+            domain = _netloc(url)
             
             if 'linkedin.com' in domain:
                 return 'linkedin'
@@ -258,87 +396,90 @@ class ExtractionCoordinator:
             priority=TaskPriority.HIGH
         )
 
-    async def _execute_concurrent_extractions(self, extraction_tasks: List[tuple]) -> Dict[str, Any]:
+    async def _execute_concurrent_extractions(self, extraction_tasks: List[tuple],
+                                              platform_counts: Dict[str, int]) -> Dict[str, Any]:
         """Execute multiple extraction tasks concurrently with rate limiting"""
-        results = {}
+        # Result slots are pre-sized per platform and filled in submission order
+        results = {platform: [None] * count for platform, count in platform_counts.items()}
         
-        # Create semaphore-controlled extraction tasks
-        async def controlled_extraction(platform: str, task: Task):
+        # Create semaphore-controlled extraction tasks that record their own results
+        async def controlled_extraction(platform: str, index: int, task: Task):
             async with self.extraction_semaphore:
                 try:
-                    agent = self.extraction_agents[platform]
+                    agent = self._get_agent(platform)
                     result = await agent.execute_task(task)
-                    return platform, result
                 except Exception as e:
                     logger.error(f"❌ {platform} extraction failed: {e}")
-                    return platform, {
+                    result = {
                         'platform': platform,
                         'url': task.data.get('url', ''),
                         'extraction_successful': False,
                         'error': str(e),
                         'agent_id': f'{platform}-agent'
                     }
-        
-        # Create async tasks
-        async_tasks = []
-        for platform, task in extraction_tasks:
-            async_task = asyncio.create_task(controlled_extraction(platform, task))
-            async_tasks.append(async_task)
+            
+            results[platform][index] = result
         
         # Wait for all extractions to complete
-        extraction_results = await asyncio.gather(*async_tasks, return_exceptions=True)
-        
-        # Process results
-        for result in extraction_results:
-            if isinstance(result, Exception):
-                logger.error(f"Extraction task exception: {result}")
-                continue
-            
-            platform, extraction_result = result
-            
-            if platform not in results:
-                results[platform] = []
-            results[platform].append(extraction_result)
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as task_group:
+                for platform, index, task in extraction_tasks:
+                    task_group.create_task(controlled_extraction(platform, index, task))
+        else:
+            await asyncio.gather(*(controlled_extraction(platform, index, task)
+                                   for platform, index, task in extraction_tasks))
         
         return results
 
     def _aggregate_extraction_results(self, platform_results: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
-        """Aggregate extraction results from all platforms"""
+        """Aggregate extraction results from all platforms in a single pass"""
         all_jobs = []
         successful_count = 0
         failed_count = 0
+        jobs_with_descriptions = 0
+        drupal_relevant_jobs = 0
         platform_stats = {}
+        extraction_timestamp = datetime.now().isoformat()
         
         for platform, results in platform_results.items():
             platform_successful = 0
-            platform_failed = 0
-            platform_jobs = []
+            platform_jobs = 0
             
             for result in results:
-                if result.get('extraction_successful', False):
-                    platform_successful += 1
-                    successful_count += 1
+                if not result.get('extraction_successful', False):
+                    continue
+                
+                platform_successful += 1
+                
+                job_data = result.get('job_data', {})
+                if job_data:
+                    # Add extraction metadata
+                    job_data.update({
+                        'extraction_platform': platform,
+                        'extraction_agent': result.get('agent_id', ''),
+                        'extraction_timestamp': result.get('extracted_at', extraction_timestamp)
+                    })
+                    all_jobs.append(job_data)
+                    platform_jobs += 1
                     
-                    job_data = result.get('job_data', {})
-                    if job_data:
-                        # Add extraction metadata
-                        job_data.update({
-                            'extraction_platform': platform,
-                            'extraction_agent': result.get('agent_id', ''),
-                            'extraction_timestamp': result.get('extracted_at', datetime.now().isoformat())
-                        })
-                        platform_jobs.append(job_data)
-                        all_jobs.append(job_data)
-                else:
-                    platform_failed += 1
-                    failed_count += 1
+                    # Summary counters computed here instead of re-scanning all_jobs afterwards
+                    description = job_data.get('description') or ''
+                    if len(description) > 100:
+                        jobs_with_descriptions += 1
+                    if 'drupal' in description.lower():
+                        drupal_relevant_jobs += 1
+            
+            platform_total = len(results)
+            platform_failed = platform_total - platform_successful
+            successful_count += platform_successful
+            failed_count += platform_failed
             
             platform_stats[platform] = {
                 'successful': platform_successful,
                 'failed': platform_failed,
-                'total': platform_successful + platform_failed,
-                'success_rate': platform_successful / max(platform_successful + platform_failed, 1),
-                'jobs_extracted': len(platform_jobs)
+                'total': platform_total,
+                'success_rate': platform_successful / max(platform_total, 1),
+                'jobs_extracted': platform_jobs
             }
         
         # Sort jobs by data quality if available
@@ -353,8 +494,8 @@ class ExtractionCoordinator:
                 'total_platforms': len(platform_results),
                 'total_extractions': successful_count + failed_count,
                 'overall_success_rate': successful_count / max(successful_count + failed_count, 1),
-                'jobs_with_descriptions': len([j for j in all_jobs if j.get('description') and len(j['description']) > 100]),
-                'drupal_relevant_jobs': len([j for j in all_jobs if 'drupal' in j.get('description', '').lower()])
+                'jobs_with_descriptions': jobs_with_descriptions,
+                'drupal_relevant_jobs': drupal_relevant_jobs
             }
         }
 
@@ -403,15 +544,32 @@ class ExtractionCoordinator:
         self.metrics.failed_extractions += total_failed
         self.metrics.total_jobs_extracted += total_jobs
         
-        # Update average extraction time
-        if self.metrics.total_extractions == 1:
-            self.metrics.avg_extraction_time = duration
-        else:
-            total_time = self.metrics.avg_extraction_time * (self.metrics.total_extractions - 1)
-            self.metrics.avg_extraction_time = (total_time + duration) / self.metrics.total_extractions
+        # Update extraction time stats from the running total rather than rescaling the previous average
+        self.metrics.total_extraction_time += duration
+        self.metrics.avg_extraction_time = self.metrics.total_extraction_time / self.metrics.total_extractions
+        self.metrics.recent_durations.append(duration)
+        
+        # Metrics changed - don't serve a status snapshot taken before this run
+        self._status_cache = None
 
     async def get_extraction_status(self) -> Dict[str, Any]:
-        """Get current extraction coordinator status"""
+        """Get current extraction coordinator status, reusing a snapshot younger than status_cache_ttl"""
+        loop = asyncio.get_running_loop()
+        if self._status_cache is not None and loop.time() - self._status_cache_time < self.status_cache_ttl:
+            return self._status_cache
+        
+        async with self._status_lock:
+            # Another caller may have refreshed the snapshot while we waited for the lock
+            if self._status_cache is None or loop.time() - self._status_cache_time >= self.status_cache_ttl:
+                self._status_cache = await self._build_extraction_status()
+                self._status_cache_time = loop.time()
+            
+            return self._status_cache
+
+    async def _build_extraction_status(self) -> Dict[str, Any]:
+        """Collect coordinator, agent, browser pool and task manager status"""
+        recent_durations = sorted(self.metrics.recent_durations)
+        
         agent_status = {}
         for platform, agent in self.extraction_agents.items():
             agent_status[platform] = agent.get_status()
@@ -429,6 +587,8 @@ class ExtractionCoordinator:
                 'success_rate': self.metrics.successful_extractions / max(self.metrics.total_extractions, 1),
                 'total_jobs_extracted': self.metrics.total_jobs_extracted,
                 'avg_extraction_time': self.metrics.avg_extraction_time,
+                'p50_extraction_time': _percentile(recent_durations, 50),
+                'p95_extraction_time': _percentile(recent_durations, 95),
                 'last_extraction': self.metrics.last_extraction.isoformat() if self.metrics.last_extraction else None,
                 'platform_stats': self.metrics.platform_stats
             },
@@ -6,20 +6,226 @@ Part of the asynchronous multi-agent job search system
 """
 
 import asyncio
+import functools
+import heapq
+import itertools
 import json
 import logging
-from typing import Dict, List, Any
-from collections import defaultdict
+import re
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter
+from operator import itemgetter
+from types import MappingProxyType
 from crewai.tools import tool
 
-from async_agent_base import SearchAgentBase
+from async_agent_base import SearchAgentBase, json_dumps, json_loads
+from keyword_matcher import build_field_matchers
+from rate_limiter import TokenBucketRateLimiter
 from task_manager import Task, TaskType, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Simulated search results per platform - immutable templates copied per search
+_MOCK_RESULTS = {
+    'upwork': (
+        MappingProxyType({
+            'title': 'Drupal 9 Website Development - Long Term',
+            'client': 'E-commerce Startup',
+            'location': 'Remote',
+            'url': 'https://upwork.com/jobs/drupal-development-123',
+            'description': 'Looking for experienced Drupal developer for ongoing website development. Must have D9/D10 experience...',
+            'posted_date': '2024-01-01',
+            'project_type': 'Hourly',
+            'budget_range': '$35-65/hour',
+            'duration': 'More than 6 months',
+            'client_rating': '4.8',
+            'client_spent': '$50,000+',
+            'proposals': '5-10'
+        }),
+        MappingProxyType({
+            'title': 'Drupal Module Development - Custom Payment Integration',
+            'client': 'Digital Agency',
+            'location': 'Remote',
+            'url': 'https://upwork.com/jobs/drupal-module-456',
+            'description': 'Need custom Drupal module for payment gateway integration. Experience with Commerce required...',
+            'posted_date': '2024-01-02',
+            'project_type': 'Fixed Price',
+            'budget_range': '$3,000-5,000',
+            'duration': '1-3 months',
+            'client_rating': '4.9',
+            'client_spent': '$25,000+',
+            'proposals': '10-15'
+        }),
+    ),
+    'toptal': (
+        MappingProxyType({
+            'title': 'Senior Drupal Architect - Enterprise Migration',
+            'client': 'Fortune 500 Company',
+            'location': 'Remote',
+            'url': 'https://toptal.com/jobs/drupal-architect-789',
+            'description': 'Elite Drupal architect needed for enterprise D7 to D10 migration. Must have scalability experience...',
+            'posted_date': '2024-01-01',
+            'project_type': 'Hourly',
+            'budget_range': '$80-120/hour',
+            'duration': '6+ months',
+            'client_tier': 'Enterprise',
+            'screening_level': 'Top 3%',
+            'proposals': 'Invitation only'
+        }),
+    ),
+    'freelancer': (
+        MappingProxyType({
+            'title': 'Drupal Website Complete Build - Competition',
+            'client': 'Small Business',
+            'location': 'Global',
+            'url': 'https://freelancer.com/projects/drupal-build-101',
+            'description': 'Complete Drupal website build for service business. Need responsive design and content management...',
+            'posted_date': '2024-01-03',
+            'project_type': 'Fixed Price',
+            'budget_range': '$1,000-3,000',
+            'duration': '1-2 months',
+            'bids': '25-50',
+            'avg_bid': '$1,500',
+            'client_reviews': '4.2'
+        }),
+    ),
+    'gun.io': (
+        MappingProxyType({
+            'title': 'Drupal Backend Developer - Vetted Network',
+            'client': 'Tech Startup',
+            'location': 'Remote US',
+            'url': 'https://gun.io/jobs/drupal-backend-202',
+            'description': 'Backend-focused Drupal developer for SaaS platform. API development and performance optimization...',
+            'posted_date': '2024-01-02',
+            'project_type': 'Contract',
+            'budget_range': '$70-95/hour',
+            'duration': '3-6 months',
+            'vetting_status': 'Pre-screened',
+            'match_score': '92%'
+        }),
+    ),
+    'arc.dev': (
+        MappingProxyType({
+            'title': 'Remote Drupal Developer - Full Stack',
+            'client': 'Remote-First Company',
+            'location': 'Anywhere',
+            'url': 'https://arc.dev/jobs/drupal-fullstack-303',
+            'description': 'Full-stack Drupal developer for remote team. Focus on headless Drupal and React frontend...',
+            'posted_date': '2024-01-01',
+            'project_type': 'Long-term Contract',
+            'budget_range': '$55-85/hour',
+            'duration': '12+ months',
+            'timezone': 'US/EU overlap',
+            'team_size': '5-10 developers'
+        }),
+    )
+}
+
 class FreelanceSearchAgent(SearchAgentBase):
     """Specialized agent for freelance platform searches with platform-specific optimizations"""
     
+    # Freelance platform configurations - static, which lets query generation be memoized
+    freelance_platforms = {
+        'upwork': {
+            'domain': 'upwork.com',
+            'focus': 'hourly and fixed-price projects',
+            'rate_structure': 'hourly',
+            'typical_range': '$25-75/hour'
+        },
+        'toptal': {
+            'domain': 'toptal.com',
+            'focus': 'elite freelancers',
+            'rate_structure': 'hourly',
+            'typical_range': '$60-150/hour'
+        },
+        'freelancer': {
+            'domain': 'freelancer.com',
+            'focus': 'competitive bidding',
+            'rate_structure': 'project',
+            'typical_range': '$500-5000/project'
+        },
+        'gun.io': {
+            'domain': 'gun.io',
+            'focus': 'vetted developers',
+            'rate_structure': 'hourly',
+            'typical_range': '$50-120/hour'
+        },
+        'arc.dev': {
+            'domain': 'arc.dev',
+            'focus': 'remote developers',
+            'rate_structure': 'hourly',
+            'typical_range': '$40-100/hour'
+        }
+    }
+
+    freelance_keywords = (
+        "drupal development",
+        "drupal website",
+        "drupal migration",
+        "drupal customization",
+        "drupal module development",
+        "drupal theme development",
+        "drupal api development",
+        "cms development drupal"
+    )
+
+    project_types = (
+        "website development",
+        "module development",
+        "theme customization",
+        "migration project",
+        "maintenance contract",
+        "api integration",
+        "performance optimization"
+    )
+
+    # Platform-specific search query templates
+    _platform_query_templates = {
+        'upwork': 'drupal developer hourly contract site:{domain}',
+        'toptal': 'senior drupal developer site:{domain}',
+        'freelancer': 'drupal project fixed price site:{domain}',
+        'gun.io': 'drupal backend developer site:{domain}',
+        'arc.dev': 'remote drupal developer site:{domain}'
+    }
+
+    # Per-field views of the platform config, derived once instead of re-walking the nested dicts
+    _platform_ids = tuple(freelance_platforms)
+    _platform_domains = tuple(info['domain'] for info in freelance_platforms.values())
+    _platform_domain_map = {platform: info['domain'] for platform, info in freelance_platforms.items()}
+    _platform_focus = {platform: info['focus'] for platform, info in freelance_platforms.items()}
+
+    # Precompiled scans for result validation and budget parsing
+    _domain_re = re.compile('|'.join(re.escape(domain) for domain in _platform_domains))
+    _relevance_re = re.compile(r'drupal|development|website|cms')
+    _budget_re = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(k\b)?', re.IGNORECASE)
+
+    # Result fields that validation and relevance scoring read in lower case
+    _text_fields = ('title', 'description', 'project_type', 'budget_range', 'duration', 'proposals')
+
+    # Relevance scoring table of (field, keywords, weight) rule groups
+    _relevance_rules = (
+        # Drupal relevance
+        (('title', ('drupal',), 4.0),
+         ('description', ('drupal',), 2.5)),
+        # Experience level and complexity
+        (('title', ('senior', 'lead', 'architect', 'expert'), 2.0),
+         ('description', ('senior', 'experienced', 'expert'), 1.0)),
+        # Project type preferences - hourly for ongoing work, long-term contracts are valuable
+        (('project_type', ('hourly',), 1.5),
+         ('project_type', ('contract',), 2.0)),
+        # Budget/rate scoring - high-value projects first
+        (('budget_range', ('60', '70', '80', '90', '100'), 2.0),
+         ('budget_range', ('40', '50'), 1.0)),
+        # Duration preferences
+        (('duration', ('6 months', '12 months', 'long term', 'ongoing'), 1.5),
+         ('duration', ('3 months', '4 months', '5 months'), 1.0)),
+        # Competition level (fewer proposals is better)
+        (('proposals', ('invitation only',), 2.0),
+         ('proposals', ('1-5', '5-10'), 1.0)),
+    )
+    _field_matchers = build_field_matchers(_relevance_rules)
+    _platform_bonus = {'toptal': 1.5, 'gun.io': 1.0}  # Premium platform, vetted network
+    
     def __init__(self, agent_id: str = None, **kwargs):
         if not agent_id:
             agent_id = f"freelance-search-{id(self)}"
@@ -30,60 +236,10 @@ class FreelanceSearchAgent(SearchAgentBase):
             **kwargs
         )
         
-        # Freelance platform configurations
-        self.freelance_platforms = {
-            'upwork': {
-                'domain': 'upwork.com',
-                'focus': 'hourly and fixed-price projects',
-                'rate_structure': 'hourly',
-                'typical_range': '$25-75/hour'
-            },
-            'toptal': {
-                'domain': 'toptal.com',
-                'focus': 'elite freelancers',
-                'rate_structure': 'hourly',
-                'typical_range': '$60-150/hour'
-            },
-            'freelancer': {
-                'domain': 'freelancer.com',
-                'focus': 'competitive bidding',
-                'rate_structure': 'project',
-                'typical_range': '$500-5000/project'
-            },
-            'gun.io': {
-                'domain': 'gun.io',
-                'focus': 'vetted developers',
-                'rate_structure': 'hourly',
-                'typical_range': '$50-120/hour'
-            },
-            'arc.dev': {
-                'domain': 'arc.dev',
-                'focus': 'remote developers',
-                'rate_structure': 'hourly',
-                'typical_range': '$40-100/hour'
-            }
+        # Per-domain request budgets shared by every search this agent runs
+        self.rate_limiters = {
+            domain: TokenBucketRateLimiter(rate=5, capacity=5) for domain in self._platform_domains
         }
-        
-        self.freelance_keywords = [
-            "drupal development",
-            "drupal website",
-            "drupal migration",
-            "drupal customization",
-            "drupal module development",
-            "drupal theme development",
-            "drupal api development",
-            "cms development drupal"
-        ]
-        
-        self.project_types = [
-            "website development",
-            "module development",
-            "theme customization",
-            "migration project",
-            "maintenance contract",
-            "api integration",
-            "performance optimization"
-        ]
 
     def get_supported_task_types(self) -> List[TaskType]:
         """Return task types this agent can handle"""
@@ -96,22 +252,20 @@ class FreelanceSearchAgent(SearchAgentBase):
         
         search_data = task.data
         query = search_data.get('query', '')
-        platforms = search_data.get('platforms', list(self.freelance_platforms.keys()))
+        platforms = search_data.get('platforms', list(self._platform_ids))
         project_type = search_data.get('project_type', 'development')
+        max_results = search_data.get('max_results')
         
         logger.info(f"🔍 Freelance search for: {query} across {len(platforms)} platforms")
         
         # Generate platform-specific search queries
         search_queries = self._generate_freelance_queries(query, platforms, project_type)
         
-        # Simulate search execution across platforms
-        results = []
-        for platform, search_query in search_queries:
-            query_results = await self._execute_freelance_search(platform, search_query)
-            results.extend(query_results)
+        # Execute all platform searches as one batch
+        results = await self._execute_freelance_search_batch(search_queries)
         
         # Process and validate results
-        processed_results = self._process_search_results(results)
+        processed_results = self._process_search_results(results, top_k=max_results)
         
         return {
             'platform': 'freelance',
@@ -127,178 +281,77 @@ class FreelanceSearchAgent(SearchAgentBase):
 
     def _generate_freelance_queries(self, base_query: str, platforms: List[str], project_type: str) -> List[tuple]:
         """Generate freelance platform-specific search queries"""
+        return list(self._generate_freelance_queries_cached(base_query.lower(), tuple(platforms), project_type))
+
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def _generate_freelance_queries_cached(cls, base_query_lower: str, platforms: Tuple[str, ...], project_type: str) -> Tuple[tuple, ...]:
+        """Memoized query generation - a pure function of the normalized inputs and the static platform config"""
         queries = []
         
         for platform in platforms:
-            if platform not in self.freelance_platforms:
+            domain = cls._platform_domain_map.get(platform)
+            if domain is None:
                 continue
-                
-            platform_info = self.freelance_platforms[platform]
-            domain = platform_info['domain']
             
             # Base keyword searches
-            for keyword in self.freelance_keywords:
-                if keyword.lower() in base_query.lower() or 'drupal' in base_query.lower():
+            for keyword in cls.freelance_keywords:
+                if keyword.lower() in base_query_lower or 'drupal' in base_query_lower:
                     # Platform-specific query format
                     query = f'{keyword} {project_type} site:{domain}'
                     queries.append((platform, query))
             
             # Project type specific searches
-            for proj_type in self.project_types:
+            for proj_type in cls.project_types:
                 if proj_type in project_type.lower():
                     query = f'drupal {proj_type} site:{domain}'
                     queries.append((platform, query))
             
             # Platform-specific searches
-            if platform == 'upwork':
-                queries.append((platform, f'drupal developer hourly contract site:{domain}'))
-            elif platform == 'toptal':
-                queries.append((platform, f'senior drupal developer site:{domain}'))
-            elif platform == 'freelancer':
-                queries.append((platform, f'drupal project fixed price site:{domain}'))
-            elif platform == 'gun.io':
-                queries.append((platform, f'drupal backend developer site:{domain}'))
-            elif platform == 'arc.dev':
-                queries.append((platform, f'remote drupal developer site:{domain}'))
-        
-        return queries[:15]  # Limit total queries
+            template = cls._platform_query_templates.get(platform)
+            if template:
+                queries.append((platform, template.format_map({'domain': domain})))
+        
+        return tuple(queries[:15])  # Limit total queries
+
+    async def _execute_freelance_search_batch(self, search_queries: List[tuple]) -> List[Dict[str, Any]]:
+        """Execute a batch of (platform, query) searches concurrently and flatten results in query order"""
+        if not search_queries:
+            return []
+        
+        query_results = await asyncio.gather(
+            *(self._execute_freelance_search(platform, search_query) for platform, search_query in search_queries)
+        )
+        return list(itertools.chain.from_iterable(query_results))
 
     async def _execute_freelance_search(self, platform: str, query: str) -> List[Dict[str, Any]]:
         """Execute freelance platform search (simulated for now)"""
-        # Simulate API delay
-        await asyncio.sleep(0.6)
-        
-        platform_info = self.freelance_platforms.get(platform, {})
+        domain = self._platform_domain_map.get(platform)
+        if domain is None:
+            return []
         
-        # Mock results based on platform characteristics
-        mock_results = self._generate_platform_specific_results(platform, platform_info)
-        
-        # Add query context to results
-        for result in mock_results:
-            result['search_query'] = query
-            result['platform'] = platform
-            result['source_platform'] = 'freelance'
-            
-        return mock_results
+        async with self.rate_limiters[domain]:
+            # Mock results based on platform characteristics
+            return self._generate_platform_specific_results(platform, query)
 
-    def _generate_platform_specific_results(self, platform: str, platform_info: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate platform-specific mock results"""
-        
-        if platform == 'upwork':
-            return [
-                {
-                    'title': 'Drupal 9 Website Development - Long Term',
-                    'client': 'E-commerce Startup',
-                    'location': 'Remote',
-                    'url': f'https://upwork.com/jobs/drupal-development-123',
-                    'description': 'Looking for experienced Drupal developer for ongoing website development. Must have D9/D10 experience...',
-                    'posted_date': '2024-01-01',
-                    'project_type': 'Hourly',
-                    'budget_range': '$35-65/hour',
-                    'duration': 'More than 6 months',
-                    'client_rating': '4.8',
-                    'client_spent': '$50,000+',
-                    'proposals': '5-10'
-                },
-                {
-                    'title': 'Drupal Module Development - Custom Payment Integration',
-                    'client': 'Digital Agency',
-                    'location': 'Remote',
-                    'url': f'https://upwork.com/jobs/drupal-module-456',
-                    'description': 'Need custom Drupal module for payment gateway integration. Experience with Commerce required...',
-                    'posted_date': '2024-01-02',
-                    'project_type': 'Fixed Price',
-                    'budget_range': '$3,000-5,000',
-                    'duration': '1-3 months',
-                    'client_rating': '4.9',
-                    'client_spent': '$25,000+',
-                    'proposals': '10-15'
-                }
-            ]
-        
-        elif platform == 'toptal':
-            return [
-                {
-                    'title': 'Senior Drupal Architect - Enterprise Migration',
-                    'client': 'Fortune 500 Company',
-                    'location': 'Remote',
-                    'url': f'https://toptal.com/jobs/drupal-architect-789',
-                    'description': 'Elite Drupal architect needed for enterprise D7 to D10 migration. Must have scalability experience...',
-                    'posted_date': '2024-01-01',
-                    'project_type': 'Hourly',
-                    'budget_range': '$80-120/hour',
-                    'duration': '6+ months',
-                    'client_tier': 'Enterprise',
-                    'screening_level': 'Top 3%',
-                    'proposals': 'Invitation only'
-                }
-            ]
-        
-        elif platform == 'freelancer':
-            return [
-                {
-                    'title': 'Drupal Website Complete Build - Competition',
-                    'client': 'Small Business',
-                    'location': 'Global',
-                    'url': f'https://freelancer.com/projects/drupal-build-101',
-                    'description': 'Complete Drupal website build for service business. Need responsive design and content management...',
-                    'posted_date': '2024-01-03',
-                    'project_type': 'Fixed Price',
-                    'budget_range': '$1,000-3,000',
-                    'duration': '1-2 months',
-                    'bids': '25-50',
-                    'avg_bid': '$1,500',
-                    'client_reviews': '4.2'
-                }
-            ]
-        
-        elif platform == 'gun.io':
-            return [
-                {
-                    'title': 'Drupal Backend Developer - Vetted Network',
-                    'client': 'Tech Startup',
-                    'location': 'Remote US',
-                    'url': f'https://gun.io/jobs/drupal-backend-202',
-                    'description': 'Backend-focused Drupal developer for SaaS platform. API development and performance optimization...',
-                    'posted_date': '2024-01-02',
-                    'project_type': 'Contract',
-                    'budget_range': '$70-95/hour',
-                    'duration': '3-6 months',
-                    'vetting_status': 'Pre-screened',
-                    'match_score': '92%'
-                }
-            ]
-        
-        elif platform == 'arc.dev':
-            return [
-                {
-                    'title': 'Remote Drupal Developer - Full Stack',
-                    'client': 'Remote-First Company',
-                    'location': 'Anywhere',
-                    'url': f'https://arc.dev/jobs/drupal-fullstack-303',
-                    'description': 'Full-stack Drupal developer for remote team. Focus on headless Drupal and React frontend...',
-                    'posted_date': '2024-01-01',
-                    'project_type': 'Long-term Contract',
-                    'budget_range': '$55-85/hour',
-                    'duration': '12+ months',
-                    'timezone': 'US/EU overlap',
-                    'team_size': '5-10 developers'
-                }
-            ]
-        
-        return []
-
-    def _process_search_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process and filter freelance search results"""
-        processed = []
-        seen_urls = set()
+    def _generate_platform_specific_results(self, platform: str, query: str) -> List[Dict[str, Any]]:
+        """Generate platform-specific mock results tagged with the query context"""
+        results = []
+        for template in _MOCK_RESULTS.get(platform, ()):
+            result = dict(template, search_query=query, platform=platform, source_platform='freelance')
+            self._normalize_budget(result)
+            results.append(result)
+        return results
+
+    def _process_search_results(self, results: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Process and filter freelance search results, keeping only the top_k most relevant when given"""
+        # Deduplicate by URL while ingesting - the first valid result for each URL is kept
+        by_url = {}
         
         for result in results:
-            # Remove duplicates
             url = result.get('url', '')
-            if url in seen_urls:
+            if url in by_url:
                 continue
-            seen_urls.add(url)
             
             # Validate required fields
             if not all(result.get(field) for field in ['title', 'client', 'url']):
@@ -306,78 +359,51 @@ class FreelanceSearchAgent(SearchAgentBase):
                 continue
             
             # Freelance-specific relevance scoring
-            relevance_score = self._calculate_freelance_relevance(result)
-            result['relevance_score'] = relevance_score
-            
-            # Only include jobs above minimum relevance threshold
-            if relevance_score >= 6.0:
-                processed.append(result)
+            result['relevance_score'] = self._calculate_freelance_relevance(result, self._lowercase_fields(result))
+            by_url[url] = result
+        
+        # Only include jobs above minimum relevance threshold
+        processed = [result for result in by_url.values() if result['relevance_score'] >= 6.0]
         
-        # Sort by relevance score
-        processed.sort(key=lambda x: x['relevance_score'], reverse=True)
+        # Sort by relevance score - a partial selection is enough when only the top results are wanted
+        if top_k is not None:
+            return heapq.nlargest(top_k, processed, key=itemgetter('relevance_score'))
+        
+        processed.sort(key=itemgetter('relevance_score'), reverse=True)
         
         return processed
 
-    def _calculate_freelance_relevance(self, job: Dict[str, Any]) -> float:
-        """Calculate freelance-specific relevance score"""
+    @staticmethod
+    def _lowercase_fields(job: Dict[str, Any]) -> Dict[str, str]:
+        """Lower-cased view of the text fields used for validation and scoring"""
+        return {field: str(job.get(field) or '').lower() for field in FreelanceSearchAgent._text_fields}
+
+    def _calculate_freelance_relevance(self, job: Dict[str, Any], fields: Dict[str, str]) -> float:
+        """Calculate freelance-specific relevance score from the job and its lower-cased view"""
         score = 5.0  # Base score
         
-        title = job.get('title', '').lower()
-        description = job.get('description', '').lower()
-        platform = job.get('platform', '')
-        budget_range = job.get('budget_range', '').lower()
+        # Scan each field once for every rule keyword, then score the first matching rule in each group
+        matched_rules = set()
+        for field, matcher in self._field_matchers.items():
+            matched_rules |= matcher.find_tags(fields[field])
         
-        # Drupal relevance
-        if 'drupal' in title:
-            score += 4.0
-        elif 'drupal' in description:
-            score += 2.5
-        
-        # Experience level and complexity
-        if any(level in title for level in ['senior', 'lead', 'architect', 'expert']):
-            score += 2.0
-        elif any(level in description for level in ['senior', 'experienced', 'expert']):
-            score += 1.0
-        
-        # Project type preferences
-        project_type = job.get('project_type', '').lower()
-        if 'hourly' in project_type:
-            score += 1.5  # Prefer hourly for ongoing work
-        elif 'contract' in project_type:
-            score += 2.0  # Long-term contracts are valuable
-        
-        # Budget/rate scoring
-        if any(rate in budget_range for rate in ['60', '70', '80', '90', '100']):
-            score += 2.0  # High-value projects
-        elif any(rate in budget_range for rate in ['40', '50']):
-            score += 1.0
+        for group_index, group in enumerate(self._relevance_rules):
+            for rule_index, (_, _, weight) in enumerate(group):
+                if (group_index, rule_index) in matched_rules:
+                    score += weight
+                    break
         
         # Platform-specific bonuses
-        if platform == 'toptal':
-            score += 1.5  # Premium platform
-        elif platform == 'gun.io':
-            score += 1.0  # Vetted network
-        elif platform == 'upwork':
+        platform = job.get('platform', '')
+        if platform == 'upwork':
             try:
                 client_rating = float(job.get('client_rating', 0))
                 if client_rating > 4.5:
                     score += 1.0  # High-rated clients
             except (ValueError, TypeError):
                 pass
-        
-        # Duration preferences
-        duration = job.get('duration', '').lower()
-        if any(term in duration for term in ['6 months', '12 months', 'long term', 'ongoing']):
-            score += 1.5
-        elif any(term in duration for term in ['3 months', '4 months', '5 months']):
-            score += 1.0
-        
-        # Competition level (fewer proposals is better)
-        proposals = job.get('proposals', '')
-        if 'invitation only' in str(proposals).lower():
-            score += 2.0
-        elif any(term in str(proposals).lower() for term in ['1-5', '5-10']):
-            score += 1.0
+        else:
+            score += self._platform_bonus.get(platform, 0.0)
         
         return min(score, 10.0)
 
@@ -387,58 +413,73 @@ class FreelanceSearchAgent(SearchAgentBase):
         try:
             # Parse query if it's JSON
             if query.startswith('{'):
-                query_data = json.loads(query)
+                query_data = json_loads(query)
                 search_query = query_data.get('query', query)
-                platforms = query_data.get('platforms', list(self.freelance_platforms.keys()))
+                platforms = query_data.get('platforms', list(self._platform_ids))
                 project_type = query_data.get('project_type', 'development')
             else:
                 search_query = query
-                platforms = list(self.freelance_platforms.keys())
+                platforms = list(self._platform_ids)
                 project_type = 'development'
             
-            # Generate freelance queries
-            freelance_queries = self._generate_freelance_queries(search_query, platforms, project_type)
-            
-            return json.dumps({
-                "platform": "freelance",
-                "platforms_available": list(self.freelance_platforms.keys()),
-                "queries_generated": len(freelance_queries),
-                "sample_queries": [q[1] for q in freelance_queries[:3]],
-                "platform_focus": {p: info['focus'] for p, info in self.freelance_platforms.items()},
-                "status": "queries_ready"
-            })
+            return self._search_platform_payload(search_query, tuple(platforms), project_type)
         except Exception as e:
-            return json.dumps({"error": str(e), "platform": "freelance"})
+            return json_dumps({"error": str(e), "platform": "freelance"})
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _search_platform_payload(cls, search_query: str, platforms: Tuple[str, ...], project_type: str) -> str:
+        """Serialized search_platform response, cached since it only depends on its inputs and static config"""
+        return json_dumps(cls._search_platform_native(search_query, platforms, project_type))
+
+    @classmethod
+    def _search_platform_native(cls, search_query: str, platforms: Tuple[str, ...], project_type: str) -> Dict[str, Any]:
+        """search_platform response as a Python dict, for in-process callers"""
+        # Generate freelance queries
+        freelance_queries = cls._generate_freelance_queries_cached(search_query.lower(), tuple(platforms), project_type)
+        
+        return {
+            "platform": "freelance",
+            "platforms_available": list(cls._platform_ids),
+            "queries_generated": len(freelance_queries),
+            "sample_queries": [q[1] for q in freelance_queries[:3]],
+            "platform_focus": dict(cls._platform_focus),
+            "status": "queries_ready"
+        }
 
     @tool
     def validate_search_results(self, results: str) -> str:
         """Freelance-specific result validation"""
         try:
-            data = json.loads(results)
-            results_list = data.get('results', [])
-            
-            validated = []
-            platform_breakdown = defaultdict(int)
-            
-            for result in results_list:
-                if self._is_valid_freelance_result(result):
-                    validated.append(result)
-                    platform_breakdown[result.get('platform', 'unknown')] += 1
-            
-            return json.dumps({
-                "platform": "freelance",
-                "total_input": len(results_list),
-                "validated_results": len(validated),
-                "results": validated[:10],
-                "validation_rate": len(validated) / len(results_list) if results_list else 0,
-                "platform_breakdown": dict(platform_breakdown),
-                "avg_budget": self._calculate_avg_budget(validated)
-            })
+            data = json_loads(results)
+            return json_dumps(self._validate_search_results_native(data.get('results', [])))
         except Exception as e:
-            return json.dumps({"error": str(e), "validated_results": 0})
+            return json_dumps({"error": str(e), "validated_results": 0})
 
-    def _is_valid_freelance_result(self, result: Dict[str, Any]) -> bool:
-        """Check if result is valid for freelance platforms"""
+    def _validate_search_results_native(self, results_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """validate_search_results response as a Python dict, for in-process callers"""
+        by_url = {}
+        
+        for result in results_list:
+            url = result.get('url', '')
+            if url and url not in by_url and self._is_valid_freelance_result(result, self._lowercase_fields(result)):
+                by_url[url] = result
+        
+        validated = list(by_url.values())
+        platform_breakdown = Counter(result.get('platform', 'unknown') for result in validated)
+        
+        return {
+            "platform": "freelance",
+            "total_input": len(results_list),
+            "validated_results": len(validated),
+            "results": validated[:10],
+            "validation_rate": len(validated) / len(results_list) if results_list else 0,
+            "platform_breakdown": dict(platform_breakdown),
+            "avg_budget": self._calculate_avg_budget(validated)
+        }
+
+    def _is_valid_freelance_result(self, result: Dict[str, Any], fields: Dict[str, str]) -> bool:
+        """Check if result is valid for freelance platforms, given its lower-cased view"""
         required_fields = ['title', 'client', 'url']
         
         # Check required fields
@@ -447,44 +488,58 @@ class FreelanceSearchAgent(SearchAgentBase):
         
         # Check if URL is from supported freelance platform
         url = result.get('url', '')
-        if not any(platform_info['domain'] in url for platform_info in self.freelance_platforms.values()):
+        if not self._domain_re.search(url):
             return False
         
         # Check for development/Drupal relevance
-        text = f"{result.get('title', '')} {result.get('description', '')}".lower()
-        if not any(term in text for term in ['drupal', 'development', 'website', 'cms']):
+        if not self._relevance_re.search(f"{fields['title']} {fields['description']}"):
             return False
         
         return True
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_budget(budget_range: str) -> Tuple[Optional[float], Optional[float], str]:
+        """Parse a dollar budget such as '$35-65/hour' or '$3,000-5,000' into (min, max, unit)"""
+        unit = 'hour' if '/hour' in budget_range.lower() else 'project'
+        if '$' not in budget_range:
+            return None, None, unit
+        
+        amounts = [
+            float(number.replace(',', '')) * (1000 if thousands else 1)
+            for number, thousands in FreelanceSearchAgent._budget_re.findall(budget_range)
+        ]
+        if not amounts:
+            return None, None, unit
+        
+        return amounts[0], amounts[1] if len(amounts) > 1 else amounts[0], unit
+
+    def _normalize_budget(self, result: Dict[str, Any]):
+        """Add numeric budget_min/budget_max/budget_unit fields parsed from budget_range"""
+        result['budget_min'], result['budget_max'], result['budget_unit'] = self._parse_budget(
+            result.get('budget_range') or ''
+        )
+
     def _calculate_avg_budget(self, validated_results: List[Dict[str, Any]]) -> str:
-        """Calculate average budget from validated results"""
-        budgets = []
+        """Calculate average budgets from validated results, hourly rates and project budgets separately"""
+        budgets: Dict[str, List[float]] = {'hour': [], 'project': []}
         for result in validated_results:
-            budget_range = result.get('budget_range', '')
-            if budget_range and '$' in budget_range:
-                # Extract numbers from budget range
-                import re
-                numbers = re.findall(r'\$(\d+)', budget_range)
-                if len(numbers) >= 2:
-                    try:
-                        avg_budget = (int(numbers[0]) + int(numbers[1])) / 2
-                        if '/hour' in budget_range:
-                            budgets.append(avg_budget)
-                        elif 'k' in budget_range.lower():
-                            budgets.append(avg_budget * 1000)
-                        else:
-                            budgets.append(avg_budget)
-                    except ValueError:
-                        continue
-        
-        if budgets:
-            avg = sum(budgets) / len(budgets)
-            if avg > 1000:
-                return f"${int(avg):,} (project)"
+            # Results from this agent were normalized at ingestion; parse anything else on the fly
+            if 'budget_min' in result:
+                budget_min, budget_max, unit = result['budget_min'], result['budget_max'], result.get('budget_unit')
             else:
-                return f"${int(avg)}/hour"
-        return "N/A"
+                budget_min, budget_max, unit = self._parse_budget(result.get('budget_range') or '')
+            
+            if budget_min is not None and budget_max is not None:
+                budgets['hour' if unit == 'hour' else 'project'].append((budget_min + budget_max) / 2)
+        
+        # Hourly rates and fixed-price budgets are never averaged together
+        averages = []
+        if budgets['hour']:
+            averages.append(f"${int(sum(budgets['hour']) / len(budgets['hour']))}/hour")
+        if budgets['project']:
+            averages.append(f"${int(sum(budgets['project']) / len(budgets['project'])):,} (project)")
+        return ', '.join(averages) or "N/A"
 
 if __name__ == "__main__":
     # Test the freelance search agent
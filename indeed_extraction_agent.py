@@ -8,20 +8,205 @@ import asyncio
 import json
 import logging
 import re
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 from crewai.tools import tool
 from urllib.parse import urlparse, parse_qs
 
-from async_agent_base import ExtractionAgentBase
+from async_agent_base import ExtractionAgentBase, json_dumps, json_loads
 from task_manager import Task, TaskType, TaskStatus
 from browser_pool_manager import BrowserPoolManager
+from keyword_matcher import KeywordMatcher
+from static_fetch import HTTPX_AVAILABLE, SELECTOLAX_AVAILABLE, BeautifulSoup, HTMLParser, create_http_client
 
 logger = logging.getLogger(__name__)
 
+# First 1000 characters of the description markup, sliced in the page so the
+# full HTML is never transferred
+RAW_HTML_SNIPPET_JS = """
+() => {
+    const html = document.querySelector('#jobDescriptionText')?.innerHTML || document.body.innerHTML.slice(0, 1000);
+    return html.length > 1000 ? html.slice(0, 1000) + '...' : html;
+}
+"""
+
+# Reads every job field in one round trip; sels is the agent's selector map
+# The apply button text check stands in for Playwright's case-insensitive
+# button:has-text("Apply now"), which querySelector doesn't support
+READ_JOB_ELEMENTS_JS = """
+(sels) => {
+    const text = el => (el && el.textContent) ? el.textContent.trim() : '';
+    const first = list => {
+        for (const selector of list) {
+            const el = document.querySelector(selector);
+            if (el) return el;
+        }
+        return null;
+    };
+    const pick = list => {
+        for (const selector of list) {
+            const value = text(document.querySelector(selector));
+            if (value) return value;
+        }
+        return '';
+    };
+    const all = selector => Array.from(document.querySelectorAll(selector));
+    return {
+        title: pick(sels.job_title),
+        company: text(first(sels.company_name)),
+        location: pick(sels.location),
+        description: pick(sels.job_description),
+        salary: pick(sels.salary),
+        attribute_snippets: all('.attribute_snippet').map(text),
+        badges: all('.jobsearch-JobInfoHeader-subtitle-item').concat(all('.attribute_snippet')).map(text),
+        company_rating: text(first(sels.company_rating)),
+        benefits: all('.jobsearch-JobDescriptionSection-benefits').concat(all('[data-testid="job-benefits"]'))
+            .flatMap(section => Array.from(section.querySelectorAll('li, .benefit-item')).map(text)),
+        indeed_apply: !!document.querySelector('button[data-testid="apply-button"], .indeed-apply-button, .ia-BasePage-button') ||
+            all('button').some(button => (button.textContent || '').toLowerCase().includes('apply now'))
+    };
+}
+"""
+
+# Patterns compiled once at import instead of on every call
+_SALARY_PREFIX_RE = re.compile(r'^(salary:?|pay:?|compensation:?)\s*', re.IGNORECASE)
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+_JOB_ID_RE = re.compile(r'indeed\.com/(?:viewjob\?jk=|jobs/view/)([a-zA-Z0-9]+)')
+
+# Zero-width characters left behind by Indeed's markup
+_ZW_TABLE = str.maketrans('', '', '\u200b\u200c\u200d\ufeff')
+
+INDEED_DOMAINS = frozenset({'indeed.com', 'www.indeed.com', 'indeed.ca', 'indeed.co.uk'})
+INDEED_JOB_URL_PREFIXES = tuple(
+    f"https://{domain}{path}" for domain in sorted(INDEED_DOMAINS) for path in ('/viewjob', '/jobs/')
+)
+
+@lru_cache(maxsize=4096)
+def _parse_indeed_url(url: str) -> Tuple[bool, str]:
+    """(is Indeed job URL, job ID) for a URL, parsed once per distinct URL"""
+    if not isinstance(url, str):
+        return False, ''
+    
+    try:
+        parsed = urlparse(url)
+    except Exception:
+        return False, ''
+    
+    is_job_url = (parsed.netloc.lower() in INDEED_DOMAINS and
+                  ('viewjob' in parsed.path or '/jobs/' in parsed.path))
+    
+    match = _JOB_ID_RE.search(url)
+    if match:
+        return is_job_url, match.group(1)
+    
+    # Try to extract from jk parameter
+    try:
+        query_params = parse_qs(parsed.query)
+        if 'jk' in query_params:
+            return is_job_url, query_params['jk'][0]
+    except Exception:
+        pass
+    
+    return is_job_url, ''
+
+# Common tech skills relevant to Drupal jobs
+SKILL_PATTERNS = {
+    'drupal': ['drupal', 'drupal 8', 'drupal 9', 'drupal 10'],
+    'php': ['php', 'php 7', 'php 8'],
+    'cms': ['cms', 'content management'],
+    'mysql': ['mysql', 'mariadb', 'database'],
+    'javascript': ['javascript', 'js', 'jquery', 'ajax'],
+    'css': ['css', 'css3', 'sass', 'scss', 'styling'],
+    'html': ['html', 'html5', 'markup'],
+    'git': ['git', 'version control', 'svn'],
+    'linux': ['linux', 'ubuntu', 'server'],
+    'apache': ['apache', 'nginx', 'web server'],
+    'composer': ['composer', 'dependency management'],
+    'twig': ['twig', 'templating'],
+    'symfony': ['symfony', 'framework'],
+    'api': ['api', 'rest', 'json', 'web services'],
+    'docker': ['docker', 'container'],
+    'aws': ['aws', 'cloud', 'amazon web services']
+}
+
+# Finds every skill keyword in one pass over the description
+_SKILL_MATCHER = KeywordMatcher(
+    (pattern, skill_category) for skill_category, patterns in SKILL_PATTERNS.items() for pattern in patterns
+)
+
+# Badge terms identifying which job detail a badge describes
+EMPLOYMENT_TYPE_TERMS = frozenset({'full-time', 'part-time', 'contract', 'temporary'})
+EXPERIENCE_LEVEL_TERMS = frozenset({'entry level', 'senior', 'mid level', 'experienced'})
+POSTED_DATE_TERMS = frozenset({'ago', 'posted', 'day', 'hour'})
+
+_DETAIL_MATCHER = KeywordMatcher(
+    [(term, 'employment_type') for term in EMPLOYMENT_TYPE_TERMS] +
+    [(term, 'experience_level') for term in EXPERIENCE_LEVEL_TERMS] +
+    [(term, 'posted_date') for term in POSTED_DATE_TERMS]
+)
+
+# Requests that are not needed to read the job text
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+BLOCKED_URL_MARKERS = ('doubleclick', 'googletag', 'google-analytics', 'scorecardresearch')
+
 class IndeedExtractionAgent(ExtractionAgentBase):
     """Specialized agent for extracting job data from Indeed with robust parsing"""
     
+    indeed_domains = INDEED_DOMAINS
+    
+    # Indeed-specific selectors, shared by every instance
+    SELECTORS = {
+        'job_title': [
+            'h1[data-testid="jobsearch-JobInfoHeader-title"]',
+            '.jobsearch-JobInfoHeader-title',
+            'h1.icl-u-xs-mb--xs.icl-u-xs-mt--none',
+            '.jobsearch-JobInfoHeader-title span[title]'
+        ],
+        'company_name': [
+            '[data-testid="inlineHeader-companyName"] a',
+            '.jobsearch-InlineCompanyRating .jobsearch-InlineCompanyRating-companyHeader a',
+            '.icl-u-lg-mr--sm.icl-u-xs-mr--xs a[data-jk]',
+            'a[data-testid="company-name"]'
+        ],
+        'location': [
+            '[data-testid="job-location"]',
+            '.jobsearch-JobInfoHeader-subtitle div',
+            '.icl-u-colorForeground--secondary.icl-u-xs-mt--xs',
+            '.jobsearch-JobInfoHeader-subtitle .icl-u-xs-mt--xs'
+        ],
+        'job_description': [
+            '#jobDescriptionText',
+            '.jobsearch-jobDescriptionText',
+            '.jobsearch-JobComponent-description',
+            '[data-testid="jobsearch-JobComponent-description"]'
+        ],
+        'salary': [
+            '.icl-u-xs-mr--xs .attribute_snippet',
+            '.jobsearch-JobInfoHeader-subtitle .attribute_snippet',
+            '[data-testid="job-salary"]',
+            '.salary-snippet'
+        ],
+        'employment_type': [
+            '.jobsearch-JobInfoHeader-subtitle .icl-u-xs-mt--xs',
+            '.jobsearch-JobDescriptionSection-sectionItem .icl-u-lg-mr--sm'
+        ],
+        'benefits': [
+            '.jobsearch-JobDescriptionSection-benefits',
+            '.jobsearch-benefits',
+            '[data-testid="job-benefits"]'
+        ],
+        'company_rating': [
+            '.icl-Ratings--gold .icl-Ratings-starsCountWrapper',
+            '[data-testid="company-rating"]',
+            '.jobsearch-InlineCompanyRating .icl-Ratings-starsCountWrapper'
+        ],
+        'job_type_badges': [
+            '.jobsearch-JobInfoHeader-subtitle .jobsearch-JobInfoHeader-subtitle-item',
+            '.attribute_snippet'
+        ]
+    }
+
     def __init__(self, agent_id: str = None, browser_pool: Optional[BrowserPoolManager] = None, **kwargs):
         if not agent_id:
             agent_id = f"indeed-extract-{id(self)}"
@@ -34,64 +219,15 @@ class IndeedExtractionAgent(ExtractionAgentBase):
         
         self.browser_pool = browser_pool
         
-        # Indeed-specific selectors
-        self.selectors = {
-            'job_title': [
-                'h1[data-testid="jobsearch-JobInfoHeader-title"]',
-                '.jobsearch-JobInfoHeader-title',
-                'h1.icl-u-xs-mb--xs.icl-u-xs-mt--none',
-                '.jobsearch-JobInfoHeader-title span[title]'
-            ],
-            'company_name': [
-                '[data-testid="inlineHeader-companyName"] a',
-                '.jobsearch-InlineCompanyRating .jobsearch-InlineCompanyRating-companyHeader a',
-                '.icl-u-lg-mr--sm.icl-u-xs-mr--xs a[data-jk]',
-                'a[data-testid="company-name"]'
-            ],
-            'location': [
-                '[data-testid="job-location"]',
-                '.jobsearch-JobInfoHeader-subtitle div',
-                '.icl-u-colorForeground--secondary.icl-u-xs-mt--xs',
-                '.jobsearch-JobInfoHeader-subtitle .icl-u-xs-mt--xs'
-            ],
-            'job_description': [
-                '#jobDescriptionText',
-                '.jobsearch-jobDescriptionText',
-                '.jobsearch-JobComponent-description',
-                '[data-testid="jobsearch-JobComponent-description"]'
-            ],
-            'salary': [
-                '.icl-u-xs-mr--xs .attribute_snippet',
-                '.jobsearch-JobInfoHeader-subtitle .attribute_snippet',
-                '[data-testid="job-salary"]',
-                '.salary-snippet'
-            ],
-            'employment_type': [
-                '.jobsearch-JobInfoHeader-subtitle .icl-u-xs-mt--xs',
-                '.jobsearch-JobDescriptionSection-sectionItem .icl-u-lg-mr--sm'
-            ],
-            'benefits': [
-                '.jobsearch-JobDescriptionSection-benefits',
-                '.jobsearch-benefits',
-                '[data-testid="job-benefits"]'
-            ],
-            'company_rating': [
-                '.icl-Ratings--gold .icl-Ratings-starsCountWrapper',
-                '[data-testid="company-rating"]',
-                '.jobsearch-InlineCompanyRating .icl-Ratings-starsCountWrapper'
-            ],
-            'job_type_badges': [
-                '.jobsearch-JobInfoHeader-subtitle .jobsearch-JobInfoHeader-subtitle-item',
-                '.attribute_snippet'
-            ]
-        }
+        # Browser reserved from the pool for this agent's lifetime, so every page
+        # opens in an already warm context
+        self._browser_id: Optional[str] = None
+        self._browser_lock = asyncio.Lock()
         
-        # Indeed domains and patterns
-        self.indeed_domains = {'indeed.com', 'www.indeed.com', 'indeed.ca', 'indeed.co.uk'}
-        self.job_url_patterns = [
-            r'indeed\.com/viewjob\?jk=([a-zA-Z0-9]+)',
-            r'indeed\.com/jobs/view/([a-zA-Z0-9]+)',
-        ]
+        # HTTP client for the static fetch path, kept open so extractions reuse connections
+        self._http_client = None
+        
+        self.selectors = self.SELECTORS
 
     def get_supported_task_types(self) -> List[TaskType]:
         """Return task types this agent can handle"""
@@ -107,13 +243,17 @@ class IndeedExtractionAgent(ExtractionAgentBase):
             raise ValueError(f"Invalid Indeed job URL: {url}")
         
         logger.info(f"🔍 Extracting Indeed job: {url}")
+        extracted_at = datetime.now().isoformat()
         
         try:
-            # Extract job data using browser pool
-            job_data = await self._extract_job_data_with_browser(url)
+            # Most of Indeed's job page is server-rendered, so try a plain HTTP fetch first
+            # and only fall back to the browser pool when the essential fields are missing
+            job_data = await self._extract_via_httpx(url)
+            if not (job_data and job_data['title'] and job_data['description']):
+                job_data = await self._extract_job_data_with_browser(url)
             
             # Validate and enhance extracted data
-            validated_data = self._validate_and_enhance_data(job_data, url)
+            validated_data = self._validate_and_enhance_data(job_data, url, extracted_at)
             
             return {
                 'platform': 'indeed',
@@ -121,7 +261,7 @@ class IndeedExtractionAgent(ExtractionAgentBase):
                 'extraction_successful': True,
                 'job_data': validated_data,
                 'agent_id': self.agent_id,
-                'extracted_at': datetime.now().isoformat()
+                'extracted_at': extracted_at
             }
             
         except Exception as e:
@@ -132,28 +272,122 @@ class IndeedExtractionAgent(ExtractionAgentBase):
                 'extraction_successful': False,
                 'error': str(e),
                 'agent_id': self.agent_id,
-                'extracted_at': datetime.now().isoformat()
+                'extracted_at': extracted_at
             }
 
+    async def process_tasks(self, tasks: List[Task], max_concurrency: Optional[int] = None) -> List[Any]:
+        """Process several Indeed extraction tasks concurrently
+        
+        Concurrency defaults to the pages one pool browser allows, since this agent
+        opens all of its pages in its reserved browser. Failed tasks yield their
+        exception in place of a result.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.max_concurrent_tasks
+            if self.browser_pool:
+                max_concurrency = min(max_concurrency, self.browser_pool.max_pages_per_browser)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def process_one(task: Task) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.process_task(task)
+        
+        return await asyncio.gather(*(process_one(task) for task in tasks), return_exceptions=True)
+
+    async def _extract_via_httpx(self, url: str) -> Optional[Dict[str, Any]]:
+        """Extract job data from the static HTML without launching a browser, None if unavailable"""
+        if not HTTPX_AVAILABLE:
+            return None
+        
+        try:
+            # A static fetch counts against the same per-domain budget as a browser page
+            if self.browser_pool:
+                await self.browser_pool.apply_rate_limiting(url)
+            response = await self._get_http_client().get(url)
+            
+            if response.status_code >= 400:
+                logger.debug("Static fetch returned HTTP %s for %s", response.status_code, url)
+                return None
+            
+            # Parsing a full job page takes long enough to stall the event loop
+            return await asyncio.to_thread(self._parse_static_html, response.text, url)
+            
+        except Exception as e:
+            logger.debug("Static fetch failed for %s: %s", url, e)
+            return None
+
+    def _parse_static_html(self, html: str, url: str) -> Dict[str, Any]:
+        """Extract job elements from server-rendered HTML, mirroring READ_JOB_ELEMENTS_JS"""
+        # Parse once and query the same tree for every field; selectolax's C parser
+        # is much faster than BeautifulSoup on full job pages
+        if SELECTOLAX_AVAILABLE:
+            tree = HTMLParser(html)
+            select_one, select = tree.css_first, tree.css
+            select_within = lambda node, selector: node.css(selector)
+            get_text = lambda node: node.text()
+        else:
+            soup = BeautifulSoup(html, 'html.parser')
+            select_one, select = soup.select_one, soup.select
+            select_within = lambda node, selector: node.select(selector)
+            get_text = lambda node: node.get_text()
+        
+        def text(element) -> str:
+            return get_text(element).strip() if element else ''
+        
+        def first(selectors: List[str]):
+            for selector in selectors:
+                element = select_one(selector)
+                if element:
+                    return element
+            return None
+        
+        def pick(selectors: List[str]) -> str:
+            for selector in selectors:
+                value = text(select_one(selector))
+                if value:
+                    return value
+            return ''
+        
+        benefit_sections = select('.jobsearch-JobDescriptionSection-benefits') + select('[data-testid="job-benefits"]')
+        elements = {
+            'title': pick(self.selectors['job_title']),
+            'company': text(first(self.selectors['company_name'])),
+            'location': pick(self.selectors['location']),
+            'description': pick(self.selectors['job_description']),
+            'salary': pick(self.selectors['salary']),
+            'attribute_snippets': [text(element) for element in select('.attribute_snippet')],
+            'badges': [text(element) for element in
+                       select('.jobsearch-JobInfoHeader-subtitle-item') + select('.attribute_snippet')],
+            'company_rating': text(first(self.selectors['company_rating'])),
+            'benefits': [text(item) for section in benefit_sections for item in select_within(section, 'li, .benefit-item')],
+            'indeed_apply': (
+                select_one('button[data-testid="apply-button"], .indeed-apply-button, .ia-BasePage-button') is not None or
+                any('apply now' in get_text(button).lower() for button in select('button'))
+            )
+        }
+        
+        return self._build_job_data(elements, url)
+
     async def _extract_job_data_with_browser(self, url: str) -> Dict[str, Any]:
         """Extract job data using browser automation"""
         if not self.browser_pool:
             raise RuntimeError("Browser pool not available for extraction")
         
-        domain_restrictions = self.indeed_domains
-        
-        async with self.browser_pool.get_page(url, domain_restrictions) as page:
+        async with await self._get_page(url) as page:
+            # Skip images, fonts, media, stylesheets and ad/analytics scripts
+            await page.route("**/*", self._block_unneeded_requests)
+            
             # Navigate to job page
             response = await page.goto(url, wait_until='domcontentloaded')
             
             if response.status >= 400:
                 raise RuntimeError(f"HTTP {response.status} error for {url}")
             
-            # Wait for key elements to load
+            # Wait for the element we actually read rather than any heading
             try:
-                await page.wait_for_selector('h1', timeout=10000)
+                await page.wait_for_selector('#jobDescriptionText', state='attached', timeout=8000)
             except:
-                logger.warning(f"Timeout waiting for job title on {url}")
+                logger.warning(f"Timeout waiting for job description on {url}")
             
             # Handle Indeed overlays and modals
             await self._handle_indeed_overlays(page)
@@ -163,6 +397,41 @@ class IndeedExtractionAgent(ExtractionAgentBase):
             
             return job_data
 
+    async def _get_page(self, url: str):
+        """Page context manager opened in this agent's reserved browser"""
+        async with self._browser_lock:
+            # The pool may have closed the browser while it sat idle
+            if self._browser_id is None or self._browser_id not in self.browser_pool.browsers:
+                self._browser_id = await self.browser_pool.acquire_browser(self.indeed_domains)
+        
+        return self.browser_pool.get_page(url, self.indeed_domains, browser_id=self._browser_id)
+
+    def _get_http_client(self):
+        """Shared keep-alive client for static fetches, HTTP/2 when h2 is installed"""
+        if self._http_client is None:
+            self._http_client = create_http_client()
+        return self._http_client
+
+    async def close(self):
+        """Release the reserved browser and the static fetch client"""
+        if self._browser_id is not None and self.browser_pool:
+            await self.browser_pool.release_browser(self._browser_id)
+            self._browser_id = None
+        
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    @staticmethod
+    async def _block_unneeded_requests(route):
+        """Route handler aborting requests that don't contribute to the job text"""
+        request = route.request
+        if (request.resource_type in BLOCKED_RESOURCE_TYPES or
+                any(marker in request.url for marker in BLOCKED_URL_MARKERS)):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def _handle_indeed_overlays(self, page):
         """Handle Indeed popups, modals, and overlays"""
         try:
@@ -178,7 +447,7 @@ class IndeedExtractionAgent(ExtractionAgentBase):
                 close_button = await page.query_selector(selector)
                 if close_button:
                     await close_button.click()
-                    await asyncio.sleep(0.5)
+                    await self._wait_for_settle(page)
             
             # Handle cookie consent
             cookie_selectors = [
@@ -191,18 +460,22 @@ class IndeedExtractionAgent(ExtractionAgentBase):
                 cookie_button = await page.query_selector(selector)
                 if cookie_button:
                     await cookie_button.click()
-                    await asyncio.sleep(0.5)
+                    await self._wait_for_settle(page)
                     break
             
-            # Wait for overlays to disappear
-            await asyncio.sleep(1)
-            
         except Exception as e:
             logger.warning(f"Error handling Indeed overlays: {e}")
 
-    async def _extract_job_elements(self, page, url: str) -> Dict[str, Any]:
-        """Extract individual job elements from the page"""
-        job_data = {
+    async def _wait_for_settle(self, page):
+        """Wait briefly for network activity triggered by an overlay click to finish"""
+        try:
+            await page.wait_for_load_state('networkidle', timeout=1500)
+        except Exception:
+            pass
+
+    def _empty_job_data(self, url: str) -> Dict[str, Any]:
+        """Job data skeleton shared by the browser and static extraction paths"""
+        return {
             'title': '',
             'company': '',
             'location': '',
@@ -218,197 +491,63 @@ class IndeedExtractionAgent(ExtractionAgentBase):
             'indeed_apply': False,
             'raw_html_snippet': ''
         }
-        
-        # Extract title
-        job_data['title'] = await self._extract_text_by_selectors(page, self.selectors['job_title'])
-        
-        # Extract company
-        company_element = await self._extract_element_by_selectors(page, self.selectors['company_name'])
-        if company_element:
-            job_data['company'] = await company_element.text_content()
-            job_data['company'] = job_data['company'].strip()
-        
-        # Extract location
-        job_data['location'] = await self._extract_text_by_selectors(page, self.selectors['location'])
-        
-        # Extract description
-        job_data['description'] = await self._extract_description(page)
-        
-        # Extract salary
-        job_data['salary'] = await self._extract_salary(page)
-        
-        # Extract employment type and job details
-        job_details = await self._extract_job_details(page)
-        job_data.update(job_details)
-        
-        # Extract company rating
-        job_data['company_rating'] = await self._extract_company_rating(page)
-        
-        # Extract benefits
-        job_data['benefits'] = await self._extract_benefits(page)
-        
-        # Check for Indeed Apply
-        job_data['indeed_apply'] = await self._check_indeed_apply(page)
-        
-        # Extract skills from description
-        job_data['skills_required'] = self._extract_skills_from_description(job_data['description'])
-        
-        # Get raw HTML snippet for debugging
-        try:
-            snippet = await page.evaluate('() => document.querySelector("#jobDescriptionText")?.innerHTML || document.body.innerHTML.slice(0, 1000)')
-            job_data['raw_html_snippet'] = snippet[:1000] + '...' if len(snippet) > 1000 else snippet
-        except:
-            pass
-        
-        return job_data
-
-    async def _extract_text_by_selectors(self, page, selectors: List[str]) -> str:
-        """Try multiple selectors to extract text content"""
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    text = await element.text_content()
-                    if text and text.strip():
-                        return text.strip()
-            except Exception as e:
-                logger.debug(f"Selector failed {selector}: {e}")
-                continue
-        return ''
-
-    async def _extract_element_by_selectors(self, page, selectors: List[str]):
-        """Try multiple selectors to extract element"""
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    return element
-            except Exception as e:
-                logger.debug(f"Selector failed {selector}: {e}")
-                continue
-        return None
 
-    async def _extract_description(self, page) -> str:
-        """Extract job description with fallback methods"""
-        description = await self._extract_text_by_selectors(page, self.selectors['job_description'])
+    async def _extract_job_elements(self, page, url: str) -> Dict[str, Any]:
+        """Extract individual job elements from the page"""
+        # Read every field in a single evaluate instead of a round trip per selector
+        elements = await page.evaluate(READ_JOB_ELEMENTS_JS, self.selectors)
+        job_data = self._build_job_data(elements, url)
         
-        if not description:
-            # Try alternative extraction methods
+        # Get raw HTML snippet for debugging; skipped entirely unless DEBUG logging is on
+        if logger.isEnabledFor(logging.DEBUG):
             try:
-                description = await page.evaluate('''
-                    () => {
-                        const desc = document.querySelector('#jobDescriptionText') || 
-                                   document.querySelector('.jobsearch-jobDescriptionText') ||
-                                   document.querySelector('.jobsearch-JobComponent-description');
-                        return desc ? desc.textContent : '';
-                    }
-                ''')
+                job_data['raw_html_snippet'] = await page.evaluate(RAW_HTML_SNIPPET_JS)
             except:
                 pass
         
-        return description.strip() if description else ''
+        return job_data
 
-    async def _extract_salary(self, page) -> str:
-        """Extract salary information"""
-        salary = await self._extract_text_by_selectors(page, self.selectors['salary'])
+    def _build_job_data(self, elements: Dict[str, Any], url: str) -> Dict[str, Any]:
+        """Assemble job data from the raw field texts read from the page or static HTML"""
+        job_data = self._empty_job_data(url)
+        
+        job_data['title'] = elements['title']
+        job_data['company'] = elements['company']
+        job_data['location'] = elements['location']
+        job_data['description'] = elements['description']
         
+        salary = elements['salary']
         if not salary:
             # Look for salary in job header
-            try:
-                salary_elements = await page.query_selector_all('.attribute_snippet')
-                for element in salary_elements:
-                    text = await element.text_content()
-                    if text and ('$' in text or 'hour' in text.lower() or 'year' in text.lower()):
-                        salary = text.strip()
-                        break
-            except:
-                pass
-        
-        return self._clean_salary_text(salary)
-
-    async def _extract_job_details(self, page) -> Dict[str, str]:
-        """Extract employment type and other job details"""
-        details = {
-            'employment_type': '',
-            'experience_level': '',
-            'posted_date': ''
-        }
-        
-        try:
-            # Look for job type badges and attributes
-            badge_elements = await page.query_selector_all('.jobsearch-JobInfoHeader-subtitle-item')
-            badge_elements.extend(await page.query_selector_all('.attribute_snippet'))
-            
-            for element in badge_elements:
-                text = await element.text_content()
-                text = text.strip().lower() if text else ''
-                
-                if any(term in text for term in ['full-time', 'part-time', 'contract', 'temporary']):
-                    details['employment_type'] = text.title()
-                elif any(term in text for term in ['entry level', 'senior', 'mid level', 'experienced']):
-                    details['experience_level'] = text.title()
-                elif any(term in text for term in ['ago', 'posted', 'day', 'hour']):
-                    details['posted_date'] = text
-        
-        except Exception as e:
-            logger.debug(f"Error extracting job details: {e}")
-        
-        return details
-
-    async def _extract_company_rating(self, page) -> str:
-        """Extract company rating"""
-        try:
-            rating_element = await self._extract_element_by_selectors(page, self.selectors['company_rating'])
-            if rating_element:
-                rating_text = await rating_element.text_content()
-                # Extract numeric rating
-                rating_match = re.search(r'(\d+\.?\d*)', rating_text)
-                if rating_match:
-                    return rating_match.group(1)
-        except Exception as e:
-            logger.debug(f"Error extracting company rating: {e}")
+            for text in elements['attribute_snippets']:
+                if text and ('$' in text or 'hour' in text.lower() or 'year' in text.lower()):
+                    salary = text
+                    break
+        job_data['salary'] = self._clean_salary_text(salary)
         
-        return ''
-
-    async def _extract_benefits(self, page) -> List[str]:
-        """Extract job benefits"""
-        benefits = []
+        job_data['experience_level'] = ''
+        for text in elements['badges']:
+            self._classify_job_detail(job_data, text.lower())
         
-        try:
-            benefits_sections = await page.query_selector_all('.jobsearch-JobDescriptionSection-benefits')
-            benefits_sections.extend(await page.query_selector_all('[data-testid="job-benefits"]'))
-            
-            for section in benefits_sections:
-                benefit_items = await section.query_selector_all('li, .benefit-item')
-                for item in benefit_items:
-                    benefit_text = await item.text_content()
-                    if benefit_text and benefit_text.strip():
-                        benefits.append(benefit_text.strip())
+        rating_match = _RATING_RE.search(elements['company_rating'])
+        if rating_match:
+            job_data['company_rating'] = rating_match.group(1)
         
-        except Exception as e:
-            logger.debug(f"Error extracting benefits: {e}")
+        job_data['benefits'] = [benefit for benefit in elements['benefits'] if benefit][:10]
+        job_data['indeed_apply'] = bool(elements['indeed_apply'])
+        job_data['skills_required'] = self._extract_skills_from_description(job_data['description'])
         
-        return benefits[:10]  # Limit to 10 benefits
+        return job_data
 
-    async def _check_indeed_apply(self, page) -> bool:
-        """Check if job has Indeed Apply feature"""
-        try:
-            apply_selectors = [
-                'button[data-testid="apply-button"]',
-                '.indeed-apply-button',
-                'button:has-text("Apply now")',
-                '.ia-BasePage-button'
-            ]
-            
-            for selector in apply_selectors:
-                apply_button = await page.query_selector(selector)
-                if apply_button:
-                    return True
-        
-        except Exception as e:
-            logger.debug(f"Error checking Indeed Apply: {e}")
-        
-        return False
+    def _classify_job_detail(self, details: Dict[str, str], text: str):
+        """Record a lower-cased badge text as employment type, experience level or posted date"""
+        found = _DETAIL_MATCHER.find_tags(text)
+        if 'employment_type' in found:
+            details['employment_type'] = text.title()
+        elif 'experience_level' in found:
+            details['experience_level'] = text.title()
+        elif 'posted_date' in found:
+            details['posted_date'] = text
 
     def _clean_salary_text(self, salary: str) -> str:
         """Clean and normalize salary text"""
@@ -416,10 +555,10 @@ class IndeedExtractionAgent(ExtractionAgentBase):
             return ''
         
         # Remove extra whitespace
-        salary = re.sub(r'\s+', ' ', salary).strip()
+        salary = ' '.join(salary.split())
         
         # Remove common prefixes
-        salary = re.sub(r'^(salary:?|pay:?|compensation:?)\s*', '', salary, flags=re.IGNORECASE)
+        salary = _SALARY_PREFIX_RE.sub('', salary)
         
         return salary
 
@@ -428,90 +567,46 @@ class IndeedExtractionAgent(ExtractionAgentBase):
         if not description:
             return []
         
-        skills = []
-        description_lower = description.lower()
-        
-        # Common tech skills relevant to Drupal jobs
-        skill_patterns = {
-            'drupal': ['drupal', 'drupal 8', 'drupal 9', 'drupal 10'],
-            'php': ['php', 'php 7', 'php 8'],
-            'cms': ['cms', 'content management'],
-            'mysql': ['mysql', 'mariadb', 'database'],
-            'javascript': ['javascript', 'js', 'jquery', 'ajax'],
-            'css': ['css', 'css3', 'sass', 'scss', 'styling'],
-            'html': ['html', 'html5', 'markup'],
-            'git': ['git', 'version control', 'svn'],
-            'linux': ['linux', 'ubuntu', 'server'],
-            'apache': ['apache', 'nginx', 'web server'],
-            'composer': ['composer', 'dependency management'],
-            'twig': ['twig', 'templating'],
-            'symfony': ['symfony', 'framework'],
-            'api': ['api', 'rest', 'json', 'web services'],
-            'docker': ['docker', 'container'],
-            'aws': ['aws', 'cloud', 'amazon web services']
-        }
-        
-        for skill_category, patterns in skill_patterns.items():
-            for pattern in patterns:
-                if pattern in description_lower:
-                    skills.append(skill_category)
-                    break
-        
-        return skills
+        found = _SKILL_MATCHER.find_tags(description.lower())
+        return [skill_category for skill_category in SKILL_PATTERNS if skill_category in found]
 
     def _extract_job_id_from_url(self, url: str) -> str:
         """Extract Indeed job ID from URL"""
-        for pattern in self.job_url_patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        # Try to extract from jk parameter
-        try:
-            parsed = urlparse(url)
-            query_params = parse_qs(parsed.query)
-            if 'jk' in query_params:
-                return query_params['jk'][0]
-        except:
-            pass
-        
-        return ''
+        return _parse_indeed_url(url)[1]
 
     def _is_indeed_job_url(self, url: str) -> bool:
         """Check if URL is a valid Indeed job URL"""
-        try:
-            parsed = urlparse(url)
-            return (parsed.netloc.lower() in self.indeed_domains and
-                    ('viewjob' in parsed.path or '/jobs/' in parsed.path))
-        except:
-            return False
+        # Canonical job URLs are recognised without parsing
+        if isinstance(url, str) and url.startswith(INDEED_JOB_URL_PREFIXES):
+            return True
+        return _parse_indeed_url(url)[0]
 
-    def _validate_and_enhance_data(self, job_data: Dict[str, Any], url: str) -> Dict[str, Any]:
-        """Validate and enhance extracted job data"""
-        validated_data = job_data.copy()
-        
+    def _validate_and_enhance_data(self, job_data: Dict[str, Any], url: str,
+                                   extracted_at: Optional[str] = None) -> Dict[str, Any]:
+        """Validate and enhance extracted job data in place, stamping it with extracted_at (default: now)"""
         # Ensure required fields
         required_fields = ['title', 'company', 'description']
         for field in required_fields:
-            if not validated_data.get(field):
+            if not job_data.get(field):
                 logger.warning(f"Missing required field '{field}' for {url}")
         
         # Add metadata
-        validated_data.update({
+        job_data.update({
             'source_url': url,
             'extraction_agent': self.agent_id,
             'platform': 'indeed',
-            'extracted_at': datetime.now().isoformat(),
-            'data_quality_score': self._calculate_data_quality_score(validated_data)
+            'extracted_at': extracted_at or datetime.now().isoformat(),
+            'data_quality_score': self._calculate_data_quality_score(job_data)
         })
         
         # Clean up text fields
         text_fields = ['title', 'company', 'location', 'description', 'employment_type', 'salary']
         for field in text_fields:
-            if validated_data.get(field):
-                validated_data[field] = self._clean_text(validated_data[field])
+            value = job_data.get(field)
+            if value:
+                job_data[field] = self._clean_text(value)
         
-        return validated_data
+        return job_data
 
     def _calculate_data_quality_score(self, job_data: Dict[str, Any]) -> float:
         """Calculate data quality score (0-10)"""
@@ -542,27 +637,21 @@ class IndeedExtractionAgent(ExtractionAgentBase):
         if not text:
             return ''
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        # Remove common artifacts
-        text = re.sub(r'[\u200b\u200c\u200d\ufeff]', '', text)  # Zero-width characters
-        
-        return text
+        # Remove zero-width characters, then collapse whitespace
+        return ' '.join(text.translate(_ZW_TABLE).split())
 
     @tool
     def extract_job_data(self, url: str) -> str:
         """Extract job data from Indeed URL - CrewAI tool interface"""
         try:
             if not self._is_indeed_job_url(url):
-                return json.dumps({
+                return json_dumps({
                     "error": "Invalid Indeed job URL",
                     "url": url,
                     "platform": "indeed"
                 })
             
-            return json.dumps({
+            return json_dumps({
                 "platform": "indeed",
                 "url": url,
                 "status": "extraction_queued",
@@ -570,7 +659,7 @@ class IndeedExtractionAgent(ExtractionAgentBase):
             })
             
         except Exception as e:
-            return json.dumps({
+            return json_dumps({
                 "error": str(e),
                 "url": url,
                 "platform": "indeed"
@@ -580,7 +669,7 @@ class IndeedExtractionAgent(ExtractionAgentBase):
     def validate_job_data(self, job_data: str) -> str:
         """Validate Indeed job data - CrewAI tool interface"""
         try:
-            data = json.loads(job_data)
+            data = json_loads(job_data)
             
             # Check required fields
             required_fields = ['title', 'company', 'url']
@@ -592,7 +681,7 @@ class IndeedExtractionAgent(ExtractionAgentBase):
             
             quality_score = self._calculate_data_quality_score(data)
             
-            return json.dumps({
+            return json_dumps({
                 "valid": len(missing_fields) == 0 and is_valid_url,
                 "platform": "indeed",
                 "missing_fields": missing_fields,
@@ -604,7 +693,7 @@ class IndeedExtractionAgent(ExtractionAgentBase):
             })
             
         except Exception as e:
-            return json.dumps({
+            return json_dumps({
                 "valid": False,
                 "error": str(e),
                 "platform": "indeed"
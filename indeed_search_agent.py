@@ -5,20 +5,158 @@ Part of the asynchronous multi-agent job search system
 """
 
 import asyncio
+import functools
+import heapq
 import json
 import logging
-from typing import Dict, List, Any
+import re
+from dataclasses import asdict, dataclass
+from itertools import chain
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from crewai.tools import tool
 
-from async_agent_base import SearchAgentBase
+from async_agent_base import SearchAgentBase, json_dumps, json_loads
+from keyword_matcher import build_field_matchers
+from rate_limiter import TokenBucketRateLimiter
 from task_manager import Task, TaskType, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Simulated Indeed results - immutable templates copied per search
+_MOCK_RESULTS = (
+    MappingProxyType({
+        'title': 'Senior Drupal Developer (Remote)',
+        'company': 'Web Development Partners',
+        'location': 'Remote',
+        'url': 'https://indeed.com/viewjob?jk=abc123def456',
+        'description': 'Senior Drupal developer needed for long-term contract project. Must have 5+ years experience with Drupal 9/10...',
+        'posted_date': '2024-01-01',
+        'employment_type': 'Contract',
+        'salary_estimate': '$75-95/hour',
+        'company_rating': '4.2',
+        'indeed_apply': True
+    }),
+    MappingProxyType({
+        'title': 'Drupal Backend Developer - Contract',
+        'company': 'Digital Solutions Group',
+        'location': 'Austin, TX (Remote OK)',
+        'url': 'https://indeed.com/viewjob?jk=xyz789ghi012',
+        'description': 'Contract position for experienced Drupal backend developer. Working on e-commerce platform migration...',
+        'posted_date': '2024-01-03',
+        'employment_type': 'Contract',
+        'salary_estimate': '$80-100/hour',
+        'company_rating': '3.8',
+        'indeed_apply': False
+    }),
+    MappingProxyType({
+        'title': 'Freelance Drupal Developer',
+        'company': 'Creative Agency LLC',
+        'location': 'Nationwide Remote',
+        'url': 'https://indeed.com/viewjob?jk=mnp345qrs678',
+        'description': 'Freelance Drupal developer for multiple client projects. Flexible schedule, competitive rates...',
+        'posted_date': '2024-01-02',
+        'employment_type': 'Freelance',
+        'salary_estimate': '$60-85/hour',
+        'company_rating': '4.0',
+        'indeed_apply': True
+    })
+)
+
+# Static tips included in every search_platform tool response
+_SEARCH_TIPS = (
+    "Use Indeed's 'Remote' location filter",
+    "Look for 'Indeed Apply' jobs for faster applications",
+    "Check company ratings for better opportunities"
+)
+
+# Fields a raw Indeed result must have, read in one C-level call
+_REQUIRED_FIELDS = itemgetter('title', 'company', 'url')
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    """Dedup key for a result URL that ignores host case, query parameter order and fragments"""
+    if not url or not isinstance(url, str):
+        return url
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+@dataclass(slots=True)
+class IndeedJob:
+    """Compact record for one Indeed result while a search is processed"""
+    title: str = ''
+    company: str = ''
+    location: str = ''
+    url: str = ''
+    description: str = ''
+    posted_date: str = ''
+    employment_type: str = ''
+    salary_estimate: str = ''
+    company_rating: str = ''
+    indeed_apply: bool = False
+    search_query: str = ''
+    platform: str = 'indeed'
+    relevance_score: float = 0.0
+
 class IndeedSearchAgent(SearchAgentBase):
     """Specialized agent for Indeed job searches with platform-specific optimizations"""
     
-    def __init__(self, agent_id: str = None, **kwargs):
+    # Queries generated per search, limited for Indeed rate limits
+    max_queries = 8
+    
+    # Indeed-specific configurations
+    indeed_domains = (
+        "indeed.com",
+        "indeed.ca", 
+        "indeed.co.uk"
+    )
+    
+    indeed_keywords = (
+        "drupal",
+        "drupal developer",
+        "drupal programmer",
+        "drupal engineer",
+        "drupal specialist",
+        "cms developer drupal",
+        "php drupal developer",
+        "web developer drupal"
+    )
+    
+    location_modifiers = (
+        "remote",
+        "work from home",
+        "telecommute",
+        "virtual",
+        "anywhere"
+    )
+    
+    # Lower-cased keyword table and domain pattern, built once for the class
+    _indeed_keywords_lower = tuple(keyword.lower() for keyword in indeed_keywords)
+    _domain_re = re.compile('|'.join(re.escape(domain) for domain in indeed_domains))
+    
+    # Relevance scoring table of (field, keywords, weight) rule groups
+    _relevance_rules = (
+        # Drupal relevance
+        (('title', ('drupal',), 3.5),
+         ('description', ('drupal',), 2.0)),
+        # Experience level bonuses
+        (('title', ('senior', 'lead', 'principal'), 1.5),
+         ('description', ('senior', 'lead', 'principal'), 1.0)),
+        # Contract/freelance preference
+        (('employment_type', ('contract', 'freelance'), 2.0),),
+        # Remote work bonus
+        (('location', tuple(modifier.lower() for modifier in location_modifiers), 1.5),),
+    )
+    _field_matchers = build_field_matchers(_relevance_rules)
+    
+    def __init__(self, agent_id: str = None, max_concurrent_searches: int = 4,
+                 max_rate: float = 10, time_period: float = 60, **kwargs):
         if not agent_id:
             agent_id = f"indeed-search-{id(self)}"
         
@@ -28,31 +166,12 @@ class IndeedSearchAgent(SearchAgentBase):
             **kwargs
         )
         
-        # Indeed-specific configurations
-        self.indeed_domains = [
-            "indeed.com",
-            "indeed.ca", 
-            "indeed.co.uk"
-        ]
+        # Bounds how many Indeed queries run at once across every task on this agent
+        self.max_concurrent_searches = max_concurrent_searches
+        self.search_semaphore = asyncio.Semaphore(max_concurrent_searches)
         
-        self.indeed_keywords = [
-            "drupal",
-            "drupal developer",
-            "drupal programmer",
-            "drupal engineer",
-            "drupal specialist",
-            "cms developer drupal",
-            "php drupal developer",
-            "web developer drupal"
-        ]
-        
-        self.location_modifiers = [
-            "remote",
-            "work from home",
-            "telecommute",
-            "virtual",
-            "anywhere"
-        ]
+        # Indeed request budget of max_rate per time_period seconds, shared by every search this agent runs
+        self.rate_limiter = TokenBucketRateLimiter(rate=max_rate / time_period, capacity=max_rate)
 
     def get_supported_task_types(self) -> List[TaskType]:
         """Return task types this agent can handle"""
@@ -66,20 +185,18 @@ class IndeedSearchAgent(SearchAgentBase):
         search_data = task.data
         query = search_data.get('query', '')
         location = search_data.get('location', 'Remote')
+        max_results = search_data.get('max_results')
         
         logger.info(f"🔍 Indeed search for: {query} in {location}")
         
         # Generate Indeed-specific search queries
         search_queries = self._generate_indeed_queries(query, location)
         
-        # Simulate search execution
-        results = []
-        for search_query in search_queries:
-            query_results = await self._execute_indeed_search(search_query)
-            results.extend(query_results)
+        # Execute all queries as one batch
+        results = await self._execute_indeed_search_batch(search_queries)
         
         # Process and validate results
-        processed_results = self._process_search_results(results)
+        processed_results = self._process_search_results(results, top_k=max_results)
         
         return {
             'platform': 'indeed',
@@ -88,164 +205,138 @@ class IndeedSearchAgent(SearchAgentBase):
             'total_queries': len(search_queries),
             'raw_results': len(results),
             'processed_results': len(processed_results),
-            'jobs': processed_results,
+            'jobs': [asdict(job) for job in processed_results],
             'agent_id': self.agent_id
         }
 
     def _generate_indeed_queries(self, base_query: str, location: str) -> List[str]:
         """Generate Indeed-specific search queries with platform optimizations"""
+        return list(self._generate_indeed_queries_cached(base_query, location))
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _generate_indeed_queries_cached(cls, base_query: str, location: str) -> Tuple[str, ...]:
+        """Memoized query generation - a pure function of the inputs and the static keyword config"""
         queries = []
+        seen = set()
+        base_query_lower = base_query.lower()
         
         # Indeed uses different query formats
-        for keyword in self.indeed_keywords:
-            if keyword.lower() in base_query.lower() or keyword == "drupal":
-                # Standard Indeed search
-                query = f'{keyword} {location} site:indeed.com'
-                queries.append(query)
-                
-                # Contract/freelance specific
-                contract_query = f'{keyword} contract {location} site:indeed.com'
-                queries.append(contract_query)
-                
-                # Remote specific
-                remote_query = f'{keyword} remote site:indeed.com'
-                queries.append(remote_query)
+        for keyword, keyword_lower in zip(cls.indeed_keywords, cls._indeed_keywords_lower):
+            if len(queries) >= cls.max_queries:
+                break
+            if keyword_lower not in base_query_lower and keyword != "drupal":
+                continue
+            
+            variants = (
+                f'{keyword} {location} site:indeed.com',           # Standard Indeed search
+                f'{keyword} contract {location} site:indeed.com',  # Contract/freelance specific
+                f'{keyword} remote site:indeed.com'                # Remote specific
+            )
+            for query in variants:
+                if query not in seen:
+                    seen.add(query)
+                    queries.append(query)
+                    if len(queries) >= cls.max_queries:
+                        break
         
         # Fallback query
         if not queries:
             queries.append(f'"{base_query}" {location} site:indeed.com')
             
-        return queries[:8]  # Limit for Indeed rate limits
+        return tuple(queries)
 
-    async def _execute_indeed_search(self, query: str) -> List[Dict[str, Any]]:
-        """Execute actual Indeed search (simulated for now)"""
-        # Simulate API delay
-        await asyncio.sleep(0.3)
-        
-        # Mock Indeed results - replace with actual Indeed API integration
-        mock_results = [
-            {
-                'title': 'Senior Drupal Developer (Remote)',
-                'company': 'Web Development Partners',
-                'location': 'Remote',
-                'url': 'https://indeed.com/viewjob?jk=abc123def456',
-                'description': 'Senior Drupal developer needed for long-term contract project. Must have 5+ years experience with Drupal 9/10...',
-                'posted_date': '2024-01-01',
-                'employment_type': 'Contract',
-                'salary_estimate': '$75-95/hour',
-                'company_rating': '4.2',
-                'indeed_apply': True
-            },
-            {
-                'title': 'Drupal Backend Developer - Contract',
-                'company': 'Digital Solutions Group',
-                'location': 'Austin, TX (Remote OK)',
-                'url': 'https://indeed.com/viewjob?jk=xyz789ghi012',
-                'description': 'Contract position for experienced Drupal backend developer. Working on e-commerce platform migration...',
-                'posted_date': '2024-01-03',
-                'employment_type': 'Contract',
-                'salary_estimate': '$80-100/hour',
-                'company_rating': '3.8',
-                'indeed_apply': False
-            },
-            {
-                'title': 'Freelance Drupal Developer',
-                'company': 'Creative Agency LLC',
-                'location': 'Nationwide Remote',
-                'url': 'https://indeed.com/viewjob?jk=mnp345qrs678',
-                'description': 'Freelance Drupal developer for multiple client projects. Flexible schedule, competitive rates...',
-                'posted_date': '2024-01-02',
-                'employment_type': 'Freelance',
-                'salary_estimate': '$60-85/hour',
-                'company_rating': '4.0',
-                'indeed_apply': True
-            }
-        ]
+    async def _execute_indeed_search_batch(self, search_queries: List[str]) -> List[IndeedJob]:
+        """Execute a batch of searches concurrently and flatten results in query order"""
+        if not search_queries:
+            return []
         
-        # Add query context to results
-        for result in mock_results:
-            result['search_query'] = query
-            result['platform'] = 'indeed'
-            
-        return mock_results
+        query_results = await asyncio.gather(
+            *(self._execute_bounded_search(search_query) for search_query in search_queries)
+        )
+        return list(chain.from_iterable(query_results))
 
-    def _process_search_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process and filter Indeed search results"""
+    async def _execute_bounded_search(self, query: str) -> List[IndeedJob]:
+        """Execute an Indeed search once one of the agent's concurrency slots is free"""
+        async with self.search_semaphore:
+            return await self._execute_indeed_search(query)
+
+    async def _execute_indeed_search(self, query: str) -> List[IndeedJob]:
+        """Execute actual Indeed search (simulated for now)"""
+        async with self.rate_limiter:
+            # Mock Indeed results - replace with actual Indeed API integration
+            return [IndeedJob(**template, search_query=query) for template in _MOCK_RESULTS]
+
+    def _process_search_results(self, results: List[IndeedJob], top_k: Optional[int] = None) -> List[IndeedJob]:
+        """Process and filter Indeed search results, keeping only the top_k most relevant when given"""
         processed = []
         seen_urls = set()
         
-        for result in results:
-            # Remove duplicates
-            url = result.get('url', '')
-            if url in seen_urls:
+        for job in results:
+            # Remove duplicates, including URLs that only differ in host case or parameter order
+            url_key = _canonical_url(job.url)
+            if url_key in seen_urls:
                 continue
-            seen_urls.add(url)
+            seen_urls.add(url_key)
             
             # Validate required fields
-            if not all(result.get(field) for field in ['title', 'company', 'url']):
+            if not (job.title and job.company and job.url):
                 logger.warning(f"Skipping invalid result: missing required fields")
                 continue
             
             # Indeed-specific relevance scoring
-            relevance_score = self._calculate_indeed_relevance(result)
-            result['relevance_score'] = relevance_score
+            job.relevance_score = self._calculate_indeed_relevance(job)
             
             # Only include jobs above minimum relevance threshold
-            if relevance_score >= 5.5:
-                processed.append(result)
+            if job.relevance_score >= 5.5:
+                processed.append(job)
         
-        # Sort by relevance score
-        processed.sort(key=lambda x: x['relevance_score'], reverse=True)
+        # Sort by relevance score - a partial selection is enough when only the top results are wanted
+        if top_k is not None:
+            return heapq.nlargest(top_k, processed, key=attrgetter('relevance_score'))
+        
+        processed.sort(key=attrgetter('relevance_score'), reverse=True)
         
         return processed
 
-    def _calculate_indeed_relevance(self, job: Dict[str, Any]) -> float:
+    def _calculate_indeed_relevance(self, job: IndeedJob) -> float:
         """Calculate Indeed-specific relevance score"""
         score = 5.0  # Base score
+        fields = {
+            'title': job.title.lower(),
+            'description': job.description.lower(),
+            'employment_type': job.employment_type.lower(),
+            'location': job.location.lower()
+        }
         
-        title = job.get('title', '').lower()
-        description = job.get('description', '').lower()
-        employment_type = job.get('employment_type', '').lower()
-        
-        # Drupal relevance
-        if 'drupal' in title:
-            score += 3.5
-        elif 'drupal' in description:
-            score += 2.0
-        
-        # Experience level bonuses
-        if any(level in title for level in ['senior', 'lead', 'principal']):
-            score += 1.5
-        elif any(level in description for level in ['senior', 'lead', 'principal']):
-            score += 1.0
-        
-        # Contract/freelance preference
-        if any(term in employment_type for term in ['contract', 'freelance']):
-            score += 2.0
+        # Scan each field once for every rule keyword, then score the first matching rule in each group
+        matched_rules = set()
+        for field, matcher in self._field_matchers.items():
+            matched_rules |= matcher.find_tags(fields[field])
         
-        # Remote work bonus
-        location = job.get('location', '').lower()
-        if any(term in location for term in self.location_modifiers):
-            score += 1.5
+        for group_index, group in enumerate(self._relevance_rules):
+            for rule_index, (_, _, weight) in enumerate(group):
+                if (group_index, rule_index) in matched_rules:
+                    score += weight
+                    break
         
         # Indeed-specific bonuses
-        if job.get('indeed_apply'):
+        if job.indeed_apply:
             score += 0.5
             
         # Company rating bonus
-        rating = job.get('company_rating')
-        if rating:
+        if job.company_rating:
             try:
-                rating_float = float(rating)
+                rating_float = float(job.company_rating)
                 if rating_float >= 4.0:
                     score += 0.5
                 elif rating_float >= 3.5:
                     score += 0.3
-            except (ValueError, TypeError):
+            except ValueError:
                 pass
         
         # Salary information bonus
-        if job.get('salary_estimate'):
+        if job.salary_estimate:
             score += 0.5
         
         return min(score, 10.0)
@@ -254,70 +345,71 @@ class IndeedSearchAgent(SearchAgentBase):
     def search_platform(self, query: str) -> str:
         """Indeed-specific search implementation for CrewAI tool"""
         try:
-            # Parse query if it's JSON
-            if query.startswith('{'):
-                query_data = json.loads(query)
-                search_query = query_data.get('query', query)
-                location = query_data.get('location', 'Remote')
-            else:
-                search_query = query
-                location = 'Remote'
+            search_query = query
+            location = 'Remote'
+            
+            # Parse query if it's JSON - malformed JSON is searched as plain text
+            stripped = query.lstrip()
+            if stripped[:1] == '{':
+                try:
+                    query_data = json_loads(stripped)
+                except ValueError:
+                    pass
+                else:
+                    search_query = query_data.get('query', query)
+                    location = query_data.get('location', 'Remote')
             
             # Generate Indeed queries
             indeed_queries = self._generate_indeed_queries(search_query, location)
             
-            return json.dumps({
+            return json_dumps({
                 "platform": "indeed",
                 "queries_generated": len(indeed_queries),
                 "queries": indeed_queries[:3],  # Return first 3 for tool response
                 "status": "queries_ready",
-                "search_tips": [
-                    "Use Indeed's 'Remote' location filter",
-                    "Look for 'Indeed Apply' jobs for faster applications",
-                    "Check company ratings for better opportunities"
-                ]
+                "search_tips": _SEARCH_TIPS
             })
         except Exception as e:
-            return json.dumps({"error": str(e), "platform": "indeed"})
+            return json_dumps({"error": str(e), "platform": "indeed"})
 
     @tool
     def validate_search_results(self, results: str) -> str:
         """Indeed-specific result validation"""
         try:
-            data = json.loads(results)
-            results_list = data.get('results', [])
-            
-            validated = []
-            for result in results_list:
-                if self._is_valid_indeed_result(result):
-                    validated.append(result)
-            
-            return json.dumps({
-                "platform": "indeed",
-                "total_input": len(results_list),
-                "validated_results": len(validated),
-                "results": validated[:10],  # Return top 10
-                "validation_rate": len(validated) / len(results_list) if results_list else 0,
-                "indeed_apply_count": sum(1 for r in validated if r.get('indeed_apply'))
-            })
+            data = json_loads(results)
+            return json_dumps(self._validate_search_results_native(data.get('results', [])))
         except Exception as e:
-            return json.dumps({"error": str(e), "validated_results": 0})
+            return json_dumps({"error": str(e), "validated_results": 0})
+
+    def _validate_search_results_native(self, results_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """validate_search_results response as a Python dict, for in-process callers"""
+        validated = [result for result in results_list if self._is_valid_indeed_result(result)]
+        
+        return {
+            "platform": "indeed",
+            "total_input": len(results_list),
+            "validated_results": len(validated),
+            "results": validated[:10],  # Return top 10
+            "validation_rate": len(validated) / len(results_list) if results_list else 0,
+            "indeed_apply_count": sum(1 for r in validated if r.get('indeed_apply'))
+        }
 
     def _is_valid_indeed_result(self, result: Dict[str, Any]) -> bool:
         """Check if result is valid for Indeed"""
-        required_fields = ['title', 'company', 'url']
-        
         # Check required fields
-        if not all(result.get(field) for field in required_fields):
+        try:
+            title, company, url = _REQUIRED_FIELDS(result)
+        except KeyError:
+            return False
+        if not (title and company and url):
             return False
         
         # Check if URL is Indeed
-        url = result.get('url', '')
-        if not any(domain in url for domain in self.indeed_domains):
+        if not self._domain_re.search(url):
             return False
         
         # Check for Drupal relevance
-        text = f"{result.get('title', '')} {result.get('description', '')}".lower()
+        text = f"{title} {result.get('description', '')}".lower()
         if 'drupal' not in text and 'cms' not in text:
             return False
         
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher - Multi-keyword substring matching for scoring and skill extraction
+Part of the asynchronous multi-agent job search system
+"""
+
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Set, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+class KeywordMatcher:
+    """Finds which tags' keywords occur in a text
+
+    With pyahocorasick installed the text is scanned once by an Aho-Corasick
+    automaton regardless of how many keywords there are; otherwise each keyword
+    is checked with a substring test.
+    """
+
+    def __init__(self, keyword_tags: Iterable[Tuple[str, Hashable]]):
+        # A keyword may belong to several tags
+        tags_by_keyword: Dict[str, Set[Hashable]] = {}
+        for keyword, tag in keyword_tags:
+            tags_by_keyword.setdefault(keyword, set()).add(tag)
+
+        self.tags_by_keyword: Dict[str, FrozenSet[Hashable]] = {
+            keyword: frozenset(tags) for keyword, tags in tags_by_keyword.items() if keyword
+        }
+
+        self.automaton = None
+        if AHOCORASICK_AVAILABLE and self.tags_by_keyword:
+            self.automaton = ahocorasick.Automaton()
+            for keyword, tags in self.tags_by_keyword.items():
+                self.automaton.add_word(keyword, tags)
+            self.automaton.make_automaton()
+
+    def find_tags(self, text: str) -> Set[Hashable]:
+        """Return the tags of every keyword that occurs in text"""
+        found: Set[Hashable] = set()
+        if not text:
+            return found
+
+        if self.automaton is not None:
+            for _, tags in self.automaton.iter(text):
+                found.update(tags)
+        else:
+            for keyword, tags in self.tags_by_keyword.items():
+                if keyword in text:
+                    found.update(tags)
+
+        return found
+
+def build_field_matchers(rule_groups: tuple) -> Dict[str, KeywordMatcher]:
+    """Build one keyword matcher per result field, tagging keywords with their (group, rule) position"""
+    keyword_tags: Dict[str, List[tuple]] = {}
+    for group_index, group in enumerate(rule_groups):
+        for rule_index, (field, keywords, _) in enumerate(group):
+            keyword_tags.setdefault(field, []).extend(
+                (keyword, (group_index, rule_index)) for keyword in keywords
+            )
+    return {field: KeywordMatcher(tags) for field, tags in keyword_tags.items()}
@@ -9,20 +9,197 @@ import json
 import logging
 import re
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from crewai.tools import tool
-from urllib.parse import urlparse, parse_qs
 
-from async_agent_base import ExtractionAgentBase
+from async_agent_base import ExtractionAgentBase, json_dumps, json_loads
+from keyword_matcher import KeywordMatcher
 from task_manager import Task, TaskType, TaskStatus
 from browser_pool_manager import BrowserPoolManager
+from extraction_cache import ExtractionCache
+from static_fetch import HTTPX_AVAILABLE, SELECTOLAX_AVAILABLE, BeautifulSoup, HTMLParser, create_http_client
 
 logger = logging.getLogger(__name__)
 
+# Paths LinkedIn redirects anonymous clients to instead of the public job page
+AUTH_WALL_PATHS = ('/authwall', '/login', '/checkpoint', '/signup')
+
+# Navigation fails fast rather than inheriting the pool's request timeout
+NAVIGATION_TIMEOUT_MS = 15000
+
+# Reads every job field in one round trip; sels is the agent's selector map
+READ_JOB_ELEMENTS_JS = """
+(sels) => {
+    const text = el => (el && el.textContent) ? el.textContent.trim() : '';
+    const pick = list => {
+        for (const selector of list) {
+            const value = text(document.querySelector(selector));
+            if (value) return value;
+        }
+        return '';
+    };
+    const all = selector => Array.from(document.querySelectorAll(selector));
+    return {
+        title: pick(sels.job_title),
+        company: pick(sels.company_name),
+        location: pick(sels.location),
+        description: pick(sels.job_description),
+        insights: sels.job_insights.flatMap(selector => all(`${selector} span`)).map(text),
+        posted_datetimes: all('time[datetime]').map(el => el.getAttribute('datetime')),
+        posted_text: pick(sels.posted_date),
+        applicant_count: pick(sels.applicant_count)
+    };
+}
+"""
+
+# First 1000 characters of the page markup, sliced in the page so the
+# full HTML is never transferred
+RAW_HTML_SNIPPET_JS = """
+() => {
+    const html = document.body.innerHTML;
+    return html.length > 1000 ? html.slice(0, 1000) + '...' : html;
+}
+"""
+
+# Patterns compiled once at import instead of on every call
+_NUM_RE = re.compile(r'(\d+)')
+
+# Delete zero-width characters and location bullets in a single C-level pass
+_ZW_TABLE = str.maketrans('', '', '\u200b\u200c\u200d\ufeff')
+_BULLET_TABLE = str.maketrans('', '', '•·')
+
+# Data quality weight per field, in bit order; the description only counts past 100 characters
+QUALITY_FIELD_WEIGHTS = (
+    ('title', 3.0),
+    ('company', 2.0),
+    ('description', 2.0),
+    ('location', 1.0),
+    ('employment_type', 0.5),
+    ('posted_date', 0.5),
+    ('skills_required', 1.0)
+)
+
+# Capped score for every combination of present fields, indexed by a bit mask
+_QUALITY_SCORES = tuple(
+    min(sum((weight for bit, (_, weight) in enumerate(QUALITY_FIELD_WEIGHTS) if mask >> bit & 1), 0.0), 10.0)
+    for mask in range(1 << len(QUALITY_FIELD_WEIGHTS))
+)
+
+LINKEDIN_DOMAINS = frozenset({'linkedin.com', 'www.linkedin.com'})
+
+# Requests aborted during extraction; none of them contribute to the job text
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+BLOCKED_URL_MARKERS = ('doubleclick', 'google-analytics', 'px.ads.linkedin', 'bat.bing', 'segment.io')
+
+# Validates a LinkedIn job URL and captures its job ID in one match
+_JOB_URL_RE = re.compile(r'^https?://(?:www\.)?linkedin\.com/jobs/(?:view|collections/[^/]+)/(\d+)', re.IGNORECASE)
+
+# Common Drupal/web development skills
+SKILL_PATTERNS = {
+    'drupal': ['drupal', 'drupal 8', 'drupal 9', 'drupal 10'],
+    'php': ['php', 'php 7', 'php 8'],
+    'cms': ['cms', 'content management'],
+    'mysql': ['mysql', 'mariadb'],
+    'javascript': ['javascript', 'js', 'jquery'],
+    'css': ['css', 'css3', 'sass', 'scss'],
+    'html': ['html', 'html5'],
+    'git': ['git', 'version control'],
+    'linux': ['linux', 'ubuntu', 'centos'],
+    'apache': ['apache', 'nginx'],
+    'composer': ['composer'],
+    'twig': ['twig'],
+    'symfony': ['symfony'],
+    'api': ['api', 'rest api', 'graphql'],
+    'docker': ['docker', 'containerization'],
+    'aws': ['aws', 'amazon web services']
+}
+
+_SKILL_MATCHER = KeywordMatcher(
+    (pattern, skill_category) for skill_category, patterns in SKILL_PATTERNS.items() for pattern in patterns
+)
+
+# Insight terms identifying which job detail an insight describes
+EMPLOYMENT_TYPE_TERMS = frozenset({'full-time', 'part-time', 'contract', 'temporary', 'internship'})
+SENIORITY_LEVEL_TERMS = frozenset({'entry level', 'associate', 'mid-senior', 'director', 'executive'})
+INDUSTRY_TERMS = frozenset({'technology', 'healthcare', 'finance', 'education'})
+FUNCTION_TERMS = frozenset({'engineering', 'marketing', 'sales', 'operations'})
+
+# Insight fields in classification priority order
+_INSIGHT_FIELDS = ('employment_type', 'seniority_level', 'industry', 'function')
+
+_INSIGHT_MATCHER = KeywordMatcher(
+    [(term, 'employment_type') for term in EMPLOYMENT_TYPE_TERMS] +
+    [(term, 'seniority_level') for term in SENIORITY_LEVEL_TERMS] +
+    [(term, 'industry') for term in INDUSTRY_TERMS] +
+    [(term, 'function') for term in FUNCTION_TERMS]
+)
+
 class LinkedInExtractionAgent(ExtractionAgentBase):
     """Specialized agent for extracting job data from LinkedIn with anti-detection measures"""
     
-    def __init__(self, agent_id: str = None, browser_pool: Optional[BrowserPoolManager] = None, **kwargs):
+    linkedin_domains = LINKEDIN_DOMAINS
+    
+    # LinkedIn-specific selectors in priority order, shared by every instance
+    SELECTORS = {
+        'job_title': [
+            'h1.t-24.t-bold.inline',
+            '.jobs-unified-top-card__job-title h1',
+            '.job-details-jobs-unified-top-card__job-title h1',
+            'h1[data-automation-id="jobPostingHeader"]',
+            'h1.top-card-layout__title'
+        ],
+        'company_name': [
+            '.jobs-unified-top-card__company-name a',
+            '.job-details-jobs-unified-top-card__company-name a',
+            '.jobs-unified-top-card__subtitle-primary-grouping a',
+            'a[data-automation-id="jobPostingCompanyLink"]',
+            'a.topcard__org-name-link'
+        ],
+        'location': [
+            '.jobs-unified-top-card__bullet',
+            '.job-details-jobs-unified-top-card__primary-description-container .t-black--light',
+            '.jobs-unified-top-card__subtitle-secondary-grouping',
+            '[data-automation-id="jobPostingLocation"]',
+            '.topcard__flavor--bullet'
+        ],
+        'job_description': [
+            '.jobs-description-content__text',
+            '.jobs-box__html-content',
+            '.job-view-layout .jobs-description',
+            '[data-automation-id="jobPostingDescription"]',
+            '.show-more-less-html__markup'
+        ],
+        # Containers whose spans hold the employment type, seniority and other insights
+        'job_insights': [
+            '.jobs-unified-top-card__job-insight',
+            '.job-details-jobs-unified-top-card__job-insight',
+            '.jobs-unified-top-card__subtitle-secondary-grouping',
+            '.description__job-criteria-item'
+        ],
+        'employment_type': [
+            '.jobs-unified-top-card__job-insight span',
+            '.job-details-jobs-unified-top-card__job-insight span',
+            '.jobs-unified-top-card__subtitle-secondary-grouping span'
+        ],
+        'seniority_level': [
+            '.jobs-unified-top-card__job-insight span',
+            '.job-details-jobs-unified-top-card__job-insight span'
+        ],
+        'posted_date': [
+            '.jobs-unified-top-card__posted-date',
+            '.job-details-jobs-unified-top-card__posted-date',
+            'time[datetime]',
+            '.posted-time-ago__text'
+        ],
+        'applicant_count': [
+            '.jobs-unified-top-card__applicant-count',
+            '.job-details-jobs-unified-top-card__applicant-count',
+            '.num-applicants__caption'
+        ]
+    }
+    
+    def __init__(self, agent_id: str = None, browser_pool: Optional[BrowserPoolManager] = None,
+                 cache_path: Optional[str] = None, cache_ttl: float = 86400, **kwargs):
         if not agent_id:
             agent_id = f"linkedin-extract-{id(self)}"
         
@@ -34,58 +211,19 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
         
         self.browser_pool = browser_pool
         
-        # LinkedIn-specific selectors
-        self.selectors = {
-            'job_title': [
-                'h1.t-24.t-bold.inline',
-                '.jobs-unified-top-card__job-title h1',
-                '.job-details-jobs-unified-top-card__job-title h1',
-                'h1[data-automation-id="jobPostingHeader"]'
-            ],
-            'company_name': [
-                '.jobs-unified-top-card__company-name a',
-                '.job-details-jobs-unified-top-card__company-name a',
-                '.jobs-unified-top-card__subtitle-primary-grouping a',
-                'a[data-automation-id="jobPostingCompanyLink"]'
-            ],
-            'location': [
-                '.jobs-unified-top-card__bullet',
-                '.job-details-jobs-unified-top-card__primary-description-container .t-black--light',
-                '.jobs-unified-top-card__subtitle-secondary-grouping',
-                '[data-automation-id="jobPostingLocation"]'
-            ],
-            'job_description': [
-                '.jobs-description-content__text',
-                '.jobs-box__html-content',
-                '.job-view-layout .jobs-description',
-                '[data-automation-id="jobPostingDescription"]'
-            ],
-            'employment_type': [
-                '.jobs-unified-top-card__job-insight span',
-                '.job-details-jobs-unified-top-card__job-insight span',
-                '.jobs-unified-top-card__subtitle-secondary-grouping span'
-            ],
-            'seniority_level': [
-                '.jobs-unified-top-card__job-insight span',
-                '.job-details-jobs-unified-top-card__job-insight span'
-            ],
-            'posted_date': [
-                '.jobs-unified-top-card__posted-date',
-                '.job-details-jobs-unified-top-card__posted-date',
-                'time[datetime]'
-            ],
-            'applicant_count': [
-                '.jobs-unified-top-card__applicant-count',
-                '.job-details-jobs-unified-top-card__applicant-count'
-            ]
-        }
+        # Browser reserved from the pool for this agent's lifetime, so every page
+        # opens in an already warm context
+        self._browser_id: Optional[str] = None
+        self._browser_lock = asyncio.Lock()
         
-        # LinkedIn domains and patterns
-        self.linkedin_domains = {'linkedin.com', 'www.linkedin.com'}
-        self.job_url_patterns = [
-            r'linkedin\.com/jobs/view/(\d+)',
-            r'linkedin\.com/jobs/collections/.*?/(\d+)',
-        ]
+        # Validated job data by LinkedIn job ID - postings rarely change once published.
+        # Opt-in: only enabled when the caller names a cache_path
+        self.cache = ExtractionCache(cache_path, ttl_seconds=cache_ttl) if cache_path else None
+        
+        # Keep-alive client for the static fetch path, created on first use
+        self._http_client = None
+        
+        self.selectors = self.SELECTORS
 
     def get_supported_task_types(self) -> List[TaskType]:
         """Return task types this agent can handle"""
@@ -100,14 +238,38 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
         if not self._is_linkedin_job_url(url):
             raise ValueError(f"Invalid LinkedIn job URL: {url}")
         
+        job_id = self._extract_job_id_from_url(url)
+        if not task.data.get('fresh'):
+            cached_data = await self._get_cached_job_data(job_id)
+            if cached_data is not None:
+                logger.info(f"💾 Using cached LinkedIn job: {url}")
+                return {
+                    'platform': 'linkedin',
+                    'url': url,
+                    'extraction_successful': True,
+                    'job_data': cached_data,
+                    'agent_id': self.agent_id,
+                    'extracted_at': cached_data.get('extracted_at'),
+                    'from_cache': True
+                }
+        
         logger.info(f"🔍 Extracting LinkedIn job: {url}")
+        extracted_at = datetime.now().isoformat()
         
         try:
-            # Extract job data using browser pool
-            job_data = await self._extract_job_data_with_browser(url)
+            # Public job postings are served as static HTML to anonymous clients, so try a
+            # plain HTTP fetch first and only fall back to the browser pool when LinkedIn
+            # gates the page or the essential fields are missing
+            job_data = await self._extract_via_httpx(url)
+            if not (job_data and job_data['title'] and job_data['description']):
+                job_data = await self._extract_job_data_with_browser(url)
             
             # Validate and enhance extracted data
-            validated_data = self._validate_and_enhance_data(job_data, url)
+            validated_data = self._validate_and_enhance_data(job_data, url, extracted_at)
+            
+            # Only pages that yielded the essential fields are worth reusing
+            if validated_data.get('title') and validated_data.get('description'):
+                await self._cache_job_data(job_id, validated_data)
             
             return {
                 'platform': 'linkedin',
@@ -115,7 +277,7 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
                 'extraction_successful': True,
                 'job_data': validated_data,
                 'agent_id': self.agent_id,
-                'extracted_at': datetime.now().isoformat()
+                'extracted_at': extracted_at
             }
             
         except Exception as e:
@@ -126,19 +288,127 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
                 'extraction_successful': False,
                 'error': str(e),
                 'agent_id': self.agent_id,
-                'extracted_at': datetime.now().isoformat()
+                'extracted_at': extracted_at
             }
 
+    async def process_tasks(self, tasks: List[Task], max_concurrency: Optional[int] = None) -> List[Any]:
+        """Process several LinkedIn extraction tasks concurrently
+        
+        Concurrency defaults to the pages one pool browser allows, since this agent
+        opens all of its pages in its reserved browser. Failed tasks yield their
+        exception in place of a result.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.max_concurrent_tasks
+            if self.browser_pool:
+                max_concurrency = min(max_concurrency, self.browser_pool.max_pages_per_browser)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def process_one(task: Task) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.process_task(task)
+        
+        return await asyncio.gather(*(process_one(task) for task in tasks), return_exceptions=True)
+
+    async def _get_cached_job_data(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cached job data for a job ID, None on a miss or when caching is off"""
+        if self.cache is None:
+            return None
+        
+        try:
+            return await asyncio.to_thread(self.cache.get, job_id)
+        except Exception as e:
+            logger.warning(f"Extraction cache read failed for job {job_id}: {e}")
+            return None
+
+    async def _cache_job_data(self, job_id: str, job_data: Dict[str, Any]):
+        """Store validated job data, never failing the extraction on cache errors"""
+        if self.cache is None:
+            return
+        
+        try:
+            await asyncio.to_thread(self.cache.put, job_id, job_data)
+        except Exception as e:
+            logger.warning(f"Extraction cache write failed for job {job_id}: {e}")
+
+    async def _extract_via_httpx(self, url: str) -> Optional[Dict[str, Any]]:
+        """Extract job data from the public job page without launching a browser, None if unavailable"""
+        if not HTTPX_AVAILABLE:
+            return None
+        
+        try:
+            # A static fetch counts against the same per-domain budget as a browser page
+            if self.browser_pool:
+                await self.browser_pool.apply_rate_limiting(url)
+            response = await self._get_http_client().get(url)
+
+            if response.status_code >= 400:
+                logger.debug(f"Static fetch returned HTTP {response.status_code} for {url}")
+                return None
+            
+            if response.url.path.startswith(AUTH_WALL_PATHS):
+                logger.debug(f"Static fetch was redirected to the LinkedIn auth wall for {url}")
+                return None
+            
+            # Parsing a full job page takes long enough to stall the event loop
+            return await asyncio.to_thread(self._parse_static_html, response.text, url)
+            
+        except Exception as e:
+            logger.debug(f"Static fetch failed for {url}: {e}")
+            return None
+
+    def _parse_static_html(self, html: str, url: str) -> Dict[str, Any]:
+        """Extract job elements from server-rendered HTML, mirroring READ_JOB_ELEMENTS_JS"""
+        # Parse once and query the same tree for every field; selectolax's C parser
+        # is much faster than BeautifulSoup on full job pages
+        if SELECTOLAX_AVAILABLE:
+            tree = HTMLParser(html)
+            select_one, select = tree.css_first, tree.css
+            get_text = lambda node: node.text()
+            get_attribute = lambda node, name: node.attributes.get(name)
+        else:
+            soup = BeautifulSoup(html, 'html.parser')
+            select_one, select = soup.select_one, soup.select
+            get_text = lambda node: node.get_text()
+            get_attribute = lambda node, name: node.get(name)
+        
+        def text(element) -> str:
+            return get_text(element).strip() if element else ''
+        
+        def pick(selectors: List[str]) -> str:
+            for selector in selectors:
+                value = text(select_one(selector))
+                if value:
+                    return value
+            return ''
+        
+        elements = {
+            'title': pick(self.selectors['job_title']),
+            'company': pick(self.selectors['company_name']),
+            'location': pick(self.selectors['location']),
+            'description': pick(self.selectors['job_description']),
+            'insights': [text(element) for container in self.selectors['job_insights']
+                         for element in select(f'{container} span')],
+            'posted_datetimes': [get_attribute(element, 'datetime') for element in select('time[datetime]')],
+            'posted_text': pick(self.selectors['posted_date']),
+            'applicant_count': pick(self.selectors['applicant_count'])
+        }
+        
+        return self._build_job_data(elements, url)
+
     async def _extract_job_data_with_browser(self, url: str) -> Dict[str, Any]:
         """Extract job data using browser automation"""
         if not self.browser_pool:
             raise RuntimeError("Browser pool not available for extraction")
         
-        domain_restrictions = self.linkedin_domains
-        
-        async with self.browser_pool.get_page(url, domain_restrictions) as page:
-            # Navigate to job page
-            response = await page.goto(url, wait_until='networkidle')
+        async with await self._get_page(url) as page:
+            # Skip images, fonts, media, stylesheets and ad/analytics requests
+            await page.route("**/*", self._block_unneeded_requests)
+            
+            # Navigate to job page; LinkedIn's analytics beacons keep the network busy
+            # long after the job is rendered, so the h1 wait below is the readiness gate
+            page.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+            response = await page.goto(url, wait_until='domcontentloaded')
             
             if response.status >= 400:
                 raise RuntimeError(f"HTTP {response.status} error for {url}")
@@ -157,6 +427,41 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
             
             return job_data
 
+    async def _get_page(self, url: str):
+        """Page context manager opened in this agent's reserved browser"""
+        async with self._browser_lock:
+            # The pool may have closed the browser while it sat idle
+            if self._browser_id is None or self._browser_id not in self.browser_pool.browsers:
+                self._browser_id = await self.browser_pool.acquire_browser(self.linkedin_domains)
+        
+        return self.browser_pool.get_page(url, self.linkedin_domains, browser_id=self._browser_id)
+
+    def _get_http_client(self):
+        """Shared keep-alive client for static fetches, HTTP/2 when h2 is installed"""
+        if self._http_client is None:
+            self._http_client = create_http_client()
+        return self._http_client
+
+    async def close(self):
+        """Release the reserved browser and the static fetch client"""
+        if self._browser_id is not None and self.browser_pool:
+            await self.browser_pool.release_browser(self._browser_id)
+            self._browser_id = None
+        
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    @staticmethod
+    async def _block_unneeded_requests(route):
+        """Route handler aborting requests that don't contribute to the job text"""
+        request = route.request
+        if (request.resource_type in BLOCKED_RESOURCE_TYPES or
+                any(marker in request.url for marker in BLOCKED_URL_MARKERS)):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def _handle_linkedin_gates(self, page):
         """Handle LinkedIn login prompts and access gates"""
         try:
@@ -183,9 +488,9 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
         except Exception as e:
             logger.warning(f"Error handling LinkedIn gates: {e}")
 
-    async def _extract_job_elements(self, page, url: str) -> Dict[str, Any]:
-        """Extract individual job elements from the page"""
-        job_data = {
+    def _empty_job_data(self, url: str) -> Dict[str, Any]:
+        """Job data skeleton shared by the browser and static extraction paths"""
+        return {
             'title': '',
             'company': '',
             'location': '',
@@ -199,74 +504,44 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
             'benefits': [],
             'raw_html_snippet': ''
         }
+
+    async def _extract_job_elements(self, page, url: str) -> Dict[str, Any]:
+        """Extract individual job elements from the page"""
+        # Read every field in a single evaluate instead of a round trip per selector
+        elements = await page.evaluate(READ_JOB_ELEMENTS_JS, self.selectors)
+        job_data = self._build_job_data(elements, url)
         
-        # Extract title
-        job_data['title'] = await self._extract_text_by_selectors(page, self.selectors['job_title'])
-        
-        # Extract company
-        company_element = await self._extract_element_by_selectors(page, self.selectors['company_name'])
-        if company_element:
-            job_data['company'] = await company_element.text_content()
-            job_data['company'] = job_data['company'].strip()
-        
-        # Extract location
-        location_text = await self._extract_text_by_selectors(page, self.selectors['location'])
-        job_data['location'] = self._clean_location_text(location_text)
-        
-        # Extract description
-        job_data['description'] = await self._extract_text_by_selectors(page, self.selectors['job_description'])
-        
-        # Extract employment type and seniority
-        insights = await self._extract_job_insights(page)
-        job_data.update(insights)
-        
-        # Extract posted date
-        posted_date = await self._extract_posted_date(page)
-        job_data['posted_date'] = posted_date
-        
-        # Extract applicant count
-        job_data['applicant_count'] = await self._extract_text_by_selectors(page, self.selectors['applicant_count'])
+        # Get raw HTML snippet for debugging; skipped entirely unless DEBUG logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                job_data['raw_html_snippet'] = await page.evaluate(RAW_HTML_SNIPPET_JS)
+            except:
+                pass
         
-        # Extract skills from description
+        return job_data
+
+    def _build_job_data(self, elements: Dict[str, Any], url: str) -> Dict[str, Any]:
+        """Assemble job data from the raw field texts read in the page"""
+        job_data = self._empty_job_data(url)
+        
+        job_data['title'] = elements['title']
+        job_data['company'] = elements['company']
+        job_data['location'] = self._clean_location_text(elements['location'])
+        job_data['description'] = elements['description']
+        job_data.update(self._classify_insights(elements['insights']))
+        
+        # Prefer the machine-readable datetime attribute over the displayed text
+        job_data['posted_date'] = next(
+            (value for value in elements['posted_datetimes'] if value), None
+        ) or self._normalize_posted_date(elements['posted_text'])
+        
+        job_data['applicant_count'] = elements['applicant_count']
         job_data['skills_required'] = self._extract_skills_from_description(job_data['description'])
         
-        # Get raw HTML snippet for debugging
-        try:
-            body_html = await page.evaluate('() => document.body.innerHTML')
-            job_data['raw_html_snippet'] = body_html[:1000] + '...' if len(body_html) > 1000 else body_html
-        except:
-            pass
-        
         return job_data
 
-    async def _extract_text_by_selectors(self, page, selectors: List[str]) -> str:
-        """Try multiple selectors to extract text content"""
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    text = await element.text_content()
-                    if text and text.strip():
-                        return text.strip()
-            except Exception as e:
-                logger.debug(f"Selector failed {selector}: {e}")
-                continue
-        return ''
-
-    async def _extract_element_by_selectors(self, page, selectors: List[str]):
-        """Try multiple selectors to extract element"""
-        for selector in selectors:
-            try:
-                element = await page.query_selector(selector)
-                if element:
-                    return element
-            except Exception as e:
-                logger.debug(f"Selector failed {selector}: {e}")
-                continue
-        return None
-
-    async def _extract_job_insights(self, page) -> Dict[str, str]:
-        """Extract employment type, seniority level, and other insights"""
+    def _classify_insights(self, texts: List[str]) -> Dict[str, str]:
+        """Classify insight texts as employment type, seniority level, industry or function"""
         insights = {
             'employment_type': '',
             'seniority_level': '',
@@ -274,86 +549,46 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
             'function': ''
         }
         
-        try:
-            # Look for insights container
-            insight_selectors = [
-                '.jobs-unified-top-card__job-insight',
-                '.job-details-jobs-unified-top-card__job-insight',
-                '.jobs-unified-top-card__subtitle-secondary-grouping'
-            ]
+        for text in texts:
+            if not text:
+                continue
             
-            for selector in insight_selectors:
-                elements = await page.query_selector_all(f'{selector} span')
-                
-                for element in elements:
-                    text = await element.text_content()
-                    text = text.strip() if text else ''
-                    
-                    if not text:
-                        continue
-                    
-                    # Classify the insight
-                    text_lower = text.lower()
-                    
-                    if any(term in text_lower for term in ['full-time', 'part-time', 'contract', 'temporary', 'internship']):
-                        insights['employment_type'] = text
-                    elif any(term in text_lower for term in ['entry level', 'associate', 'mid-senior', 'director', 'executive']):
-                        insights['seniority_level'] = text
-                    elif any(term in text_lower for term in ['technology', 'healthcare', 'finance', 'education']):
-                        insights['industry'] = text
-                    elif any(term in text_lower for term in ['engineering', 'marketing', 'sales', 'operations']):
-                        insights['function'] = text
-        
-        except Exception as e:
-            logger.debug(f"Error extracting job insights: {e}")
+            # Classify the insight by the first field, in priority order, whose terms it contains
+            found = _INSIGHT_MATCHER.find_tags(text.lower())
+            for field in _INSIGHT_FIELDS:
+                if field in found:
+                    insights[field] = text
+                    break
         
         return insights
 
-    async def _extract_posted_date(self, page) -> str:
-        """Extract and normalize posted date"""
-        try:
-            # Try datetime attribute first
-            time_elements = await page.query_selector_all('time[datetime]')
-            for element in time_elements:
-                datetime_value = await element.get_attribute('datetime')
-                if datetime_value:
-                    return datetime_value
-            
-            # Fall back to text content
-            date_text = await self._extract_text_by_selectors(page, self.selectors['posted_date'])
-            
-            if date_text:
-                # Normalize common LinkedIn date formats
-                date_text = date_text.lower().strip()
-                
-                if 'ago' in date_text:
-                    return self._parse_relative_date(date_text)
-                else:
-                    return date_text
+    def _normalize_posted_date(self, date_text: str) -> str:
+        """Normalize common LinkedIn date formats, resolving relative dates"""
+        if not date_text:
+            return ''
         
-        except Exception as e:
-            logger.debug(f"Error extracting posted date: {e}")
+        date_text = date_text.lower().strip()
         
-        return ''
+        if 'ago' in date_text:
+            return self._parse_relative_date(date_text)
+        return date_text
 
     def _parse_relative_date(self, date_text: str) -> str:
         """Parse relative dates like '2 days ago' into ISO format"""
         try:
-            from datetime import timedelta
-            
             now = datetime.now()
             
             if 'hour' in date_text:
-                hours = int(re.search(r'(\d+)', date_text).group(1))
+                hours = int(_NUM_RE.search(date_text).group(1))
                 date = now - timedelta(hours=hours)
             elif 'day' in date_text:
-                days = int(re.search(r'(\d+)', date_text).group(1))
+                days = int(_NUM_RE.search(date_text).group(1))
                 date = now - timedelta(days=days)
             elif 'week' in date_text:
-                weeks = int(re.search(r'(\d+)', date_text).group(1))
+                weeks = int(_NUM_RE.search(date_text).group(1))
                 date = now - timedelta(weeks=weeks)
             elif 'month' in date_text:
-                months = int(re.search(r'(\d+)', date_text).group(1))
+                months = int(_NUM_RE.search(date_text).group(1))
                 date = now - timedelta(days=months * 30)
             else:
                 return date_text
@@ -368,10 +603,8 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
         if not location:
             return ''
         
-        # Remove extra whitespace and bullet points
-        location = re.sub(r'[•·]', '', location)
-        location = re.sub(r'\s+', ' ', location)
-        location = location.strip()
+        # Remove bullet points, then collapse whitespace
+        location = ' '.join(location.translate(_BULLET_TABLE).split())
         
         # Extract main location (remove secondary info)
         if '(' in location:
@@ -384,57 +617,22 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
         if not description:
             return []
         
-        drupal_skills = []
-        description_lower = description.lower()
-        
-        # Common Drupal/web development skills
-        skill_patterns = {
-            'drupal': ['drupal', 'drupal 8', 'drupal 9', 'drupal 10'],
-            'php': ['php', 'php 7', 'php 8'],
-            'cms': ['cms', 'content management'],
-            'mysql': ['mysql', 'mariadb'],
-            'javascript': ['javascript', 'js', 'jquery'],
-            'css': ['css', 'css3', 'sass', 'scss'],
-            'html': ['html', 'html5'],
-            'git': ['git', 'version control'],
-            'linux': ['linux', 'ubuntu', 'centos'],
-            'apache': ['apache', 'nginx'],
-            'composer': ['composer'],
-            'twig': ['twig'],
-            'symfony': ['symfony'],
-            'api': ['api', 'rest api', 'graphql'],
-            'docker': ['docker', 'containerization'],
-            'aws': ['aws', 'amazon web services']
-        }
-        
-        for skill_category, patterns in skill_patterns.items():
-            for pattern in patterns:
-                if pattern in description_lower:
-                    drupal_skills.append(skill_category)
-                    break
-        
-        return drupal_skills
+        # One keyword scan of the description, reported in the skill table's category order
+        found = _SKILL_MATCHER.find_tags(description.lower())
+        return [skill_category for skill_category in SKILL_PATTERNS if skill_category in found]
 
     def _extract_job_id_from_url(self, url: str) -> str:
         """Extract LinkedIn job ID from URL"""
-        for pattern in self.job_url_patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return ''
+        match = _JOB_URL_RE.match(url) if isinstance(url, str) else None
+        return match.group(1) if match else ''
 
     def _is_linkedin_job_url(self, url: str) -> bool:
         """Check if URL is a valid LinkedIn job URL"""
-        try:
-            parsed = urlparse(url)
-            return (parsed.netloc.lower() in self.linkedin_domains and
-                    '/jobs/' in parsed.path and
-                    any(re.search(pattern, url) for pattern in self.job_url_patterns))
-        except:
-            return False
-
-    def _validate_and_enhance_data(self, job_data: Dict[str, Any], url: str) -> Dict[str, Any]:
-        """Validate and enhance extracted job data"""
+        return isinstance(url, str) and _JOB_URL_RE.match(url) is not None
+
+    def _validate_and_enhance_data(self, job_data: Dict[str, Any], url: str,
+                                   extracted_at: Optional[str] = None) -> Dict[str, Any]:
+        """Validate and enhance extracted job data, stamping it with extracted_at (default: now)"""
         validated_data = job_data.copy()
         
         # Ensure required fields
@@ -448,7 +646,7 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
             'source_url': url,
             'extraction_agent': self.agent_id,
             'platform': 'linkedin',
-            'extracted_at': datetime.now().isoformat(),
+            'extracted_at': extracted_at or datetime.now().isoformat(),
             'data_quality_score': self._calculate_data_quality_score(validated_data)
         })
         
@@ -462,48 +660,35 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
 
     def _calculate_data_quality_score(self, job_data: Dict[str, Any]) -> float:
         """Calculate data quality score (0-10)"""
-        score = 0.0
-        
-        # Required fields
-        if job_data.get('title'):
-            score += 3.0
-        if job_data.get('company'):
-            score += 2.0
-        if job_data.get('description') and len(job_data['description']) > 100:
-            score += 2.0
-        
-        # Optional but valuable fields
-        if job_data.get('location'):
-            score += 1.0
-        if job_data.get('employment_type'):
-            score += 0.5
-        if job_data.get('posted_date'):
-            score += 0.5
-        if job_data.get('skills_required'):
-            score += 1.0
-        
-        return min(score, 10.0)
+        get = job_data.get
+        description = get('description')
+        
+        # One bit per QUALITY_FIELD_WEIGHTS entry, looked up in the precomputed score table
+        mask = (
+            bool(get('title'))
+            | bool(get('company')) << 1
+            | bool(description and len(description) > 100) << 2
+            | bool(get('location')) << 3
+            | bool(get('employment_type')) << 4
+            | bool(get('posted_date')) << 5
+            | bool(get('skills_required')) << 6
+        )
+        return _QUALITY_SCORES[mask]
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content"""
         if not text:
             return ''
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        # Remove common artifacts
-        text = re.sub(r'[\u200b\u200c\u200d\ufeff]', '', text)  # Zero-width characters
-        
-        return text
+        # Remove zero-width characters, then collapse whitespace
+        return ' '.join(text.translate(_ZW_TABLE).split())
 
     @tool
     def extract_job_data(self, url: str) -> str:
         """Extract job data from LinkedIn URL - CrewAI tool interface"""
         try:
             if not self._is_linkedin_job_url(url):
-                return json.dumps({
+                return json_dumps({
                     "error": "Invalid LinkedIn job URL",
                     "url": url,
                     "platform": "linkedin"
@@ -511,7 +696,7 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
             
             # Note: This is a synchronous tool interface
             # In practice, this would need to be called from an async context
-            return json.dumps({
+            return json_dumps({
                 "platform": "linkedin",
                 "url": url,
                 "status": "extraction_queued",
@@ -519,7 +704,7 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
             })
             
         except Exception as e:
-            return json.dumps({
+            return json_dumps({
                 "error": str(e),
                 "url": url,
                 "platform": "linkedin"
@@ -529,7 +714,7 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
     def validate_job_data(self, job_data: str) -> str:
         """Validate LinkedIn job data - CrewAI tool interface"""
         try:
-            data = json.loads(job_data)
+            data = json_loads(job_data)
             
             # Check required fields
             required_fields = ['title', 'company', 'url']
@@ -541,7 +726,7 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
             
             quality_score = self._calculate_data_quality_score(data)
             
-            return json.dumps({
+            return json_dumps({
                 "valid": len(missing_fields) == 0 and is_valid_url,
                 "platform": "linkedin",
                 "missing_fields": missing_fields,
@@ -552,7 +737,7 @@ class LinkedInExtractionAgent(ExtractionAgentBase):
             })
             
         except Exception as e:
-            return json.dumps({
+            return json_dumps({
                 "valid": False,
                 "error": str(e),
                 "platform": "linkedin"
@@ -7,10 +7,12 @@ Part of the asynchronous multi-agent job search system
 import asyncio
 import json
 import logging
+import re
 from typing import Dict, List, Any
 from crewai.tools import tool
 
 from async_agent_base import SearchAgentBase
+from rate_limiter import TokenBucketRateLimiter
 from task_manager import Task, TaskType, TaskStatus
 
 logger = logging.getLogger(__name__)
@@ -18,7 +20,8 @@ logger = logging.getLogger(__name__)
 class LinkedInSearchAgent(SearchAgentBase):
     """Specialized agent for LinkedIn job searches with platform-specific optimizations"""
     
-    def __init__(self, agent_id: str = None, **kwargs):
+    def __init__(self, agent_id: str = None, max_concurrent_searches: int = 5,
+                 max_rate: float = 10, time_period: float = 10, **kwargs):
         if not agent_id:
             agent_id = f"linkedin-search-{id(self)}"
         
@@ -28,6 +31,13 @@ class LinkedInSearchAgent(SearchAgentBase):
             **kwargs
         )
         
+        # Bounds how many LinkedIn queries are in flight at once across every task on this agent
+        self.max_concurrent_searches = max_concurrent_searches
+        self.search_semaphore = asyncio.Semaphore(max_concurrent_searches)
+        
+        # LinkedIn request budget of max_rate per time_period seconds, shared by every search this agent runs
+        self.rate_limiter = TokenBucketRateLimiter(rate=max_rate / time_period, capacity=max_rate)
+        
         # LinkedIn-specific configurations
         self.linkedin_domains = [
             "linkedin.com/jobs",
@@ -55,6 +65,13 @@ class LinkedInSearchAgent(SearchAgentBase):
             "project-based",
             "part-time"
         ]
+        
+        # Lower-cased keyword table, term patterns and required fields, built once instead of per result
+        self._linkedin_keywords_lower = tuple(keyword.lower() for keyword in self.linkedin_keywords)
+        self._senior_re = re.compile('senior|lead|principal|architect')
+        self._contract_re = re.compile('contract|freelance|temporary')
+        self._remote_re = re.compile('remote|work from home|anywhere')
+        self._required_fields = ('title', 'company', 'url')
 
     def get_supported_task_types(self) -> List[TaskType]:
         """Return task types this agent can handle"""
@@ -74,11 +91,18 @@ class LinkedInSearchAgent(SearchAgentBase):
         # Generate LinkedIn-specific search queries
         search_queries = self._generate_linkedin_queries(query, location)
         
-        # Simulate search execution (replace with actual LinkedIn API/scraping)
+        # Run the queries concurrently, keeping results in query order; a failed
+        # query is logged and skipped instead of failing the whole search
+        query_results = await asyncio.gather(
+            *(self._execute_linkedin_search(search_query) for search_query in search_queries),
+            return_exceptions=True
+        )
         results = []
-        for search_query in search_queries:
-            query_results = await self._execute_linkedin_search(search_query)
-            results.extend(query_results)
+        for search_query, query_result in zip(search_queries, query_results):
+            if isinstance(query_result, BaseException):
+                logger.warning(f"⚠️ LinkedIn query failed ({search_query}): {query_result}")
+                continue
+            results.extend(query_result)
         
         # Process and validate results
         processed_results = self._process_search_results(results)
@@ -97,10 +121,11 @@ class LinkedInSearchAgent(SearchAgentBase):
     def _generate_linkedin_queries(self, base_query: str, location: str) -> List[str]:
         """Generate LinkedIn-specific search queries with platform optimizations"""
         queries = []
+        base_query_lower = base_query.lower()
         
         # Base query variations
-        for keyword in self.linkedin_keywords:
-            if keyword.lower() in base_query.lower():
+        for keyword, keyword_lower in zip(self.linkedin_keywords, self._linkedin_keywords_lower):
+            if keyword_lower in base_query_lower:
                 # Core search
                 query = f'"{keyword}" {location} site:linkedin.com/jobs'
                 queries.append(query)
@@ -117,42 +142,40 @@ class LinkedInSearchAgent(SearchAgentBase):
         return queries[:10]  # Limit to prevent rate limiting
 
     async def _execute_linkedin_search(self, query: str) -> List[Dict[str, Any]]:
-        """Execute actual LinkedIn search (simulated for now)"""
-        # Simulate API delay
-        await asyncio.sleep(0.5)
-        
-        # Mock results - replace with actual LinkedIn API integration
-        mock_results = [
-            {
-                'title': 'Senior Drupal Developer - Remote',
-                'company': 'Tech Solutions Inc.',
-                'location': 'Remote, USA',
-                'url': 'https://linkedin.com/jobs/view/123456789',
-                'description': 'We are seeking a Senior Drupal Developer for remote contract work...',
-                'posted_date': '2024-01-01',
-                'employment_type': 'Contract',
-                'experience_level': 'Senior',
-                'salary_range': '$80-120/hour'
-            },
-            {
-                'title': 'Drupal Technical Lead',
-                'company': 'Digital Agency Corp',
-                'location': 'New York, NY (Remote OK)',
-                'url': 'https://linkedin.com/jobs/view/987654321',
-                'description': 'Lead Drupal developer position with remote flexibility...',
-                'posted_date': '2024-01-02',
-                'employment_type': 'Full-time',
-                'experience_level': 'Lead',
-                'salary_range': '$120,000-150,000'
-            }
-        ]
-        
-        # Add query context to results
-        for result in mock_results:
-            result['search_query'] = query
-            result['platform'] = 'linkedin'
+        """Execute actual LinkedIn search (simulated for now) once a concurrency slot is free"""
+        async with self.search_semaphore, self.rate_limiter:
+            # Mock results - replace with actual LinkedIn API integration
+            mock_results = [
+                {
+                    'title': 'Senior Drupal Developer - Remote',
+                    'company': 'Tech Solutions Inc.',
+                    'location': 'Remote, USA',
+                    'url': 'https://linkedin.com/jobs/view/123456789',
+                    'description': 'We are seeking a Senior Drupal Developer for remote contract work...',
+                    'posted_date': '2024-01-01',
+                    'employment_type': 'Contract',
+                    'experience_level': 'Senior',
+                    'salary_range': '$80-120/hour'
+                },
+                {
+                    'title': 'Drupal Technical Lead',
+                    'company': 'Digital Agency Corp',
+                    'location': 'New York, NY (Remote OK)',
+                    'url': 'https://linkedin.com/jobs/view/987654321',
+                    'description': 'Lead Drupal developer position with remote flexibility...',
+                    'posted_date': '2024-01-02',
+                    'employment_type': 'Full-time',
+                    'experience_level': 'Lead',
+                    'salary_range': '$120,000-150,000'
+                }
+            ]
+        
+            # Add query context to results
+            for result in mock_results:
+                result['search_query'] = query
+                result['platform'] = 'linkedin'
             
-        return mock_results
+            return mock_results
 
     def _process_search_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process and filter LinkedIn search results"""
@@ -167,7 +190,7 @@ class LinkedInSearchAgent(SearchAgentBase):
             seen_urls.add(url)
             
             # Validate required fields
-            if not all(result.get(field) for field in ['title', 'company', 'url']):
+            if not all(result.get(field) for field in self._required_fields):
                 logger.warning(f"Skipping invalid result: missing required fields")
                 continue
             
@@ -199,16 +222,16 @@ class LinkedInSearchAgent(SearchAgentBase):
             score += 2.0
         
         # Experience level bonuses
-        if any(level in title for level in ['senior', 'lead', 'principal', 'architect']):
+        if self._senior_re.search(title):
             score += 2.0
         
         # Contract/freelance preference
-        if any(term in employment_type for term in ['contract', 'freelance', 'temporary']):
+        if self._contract_re.search(employment_type):
             score += 1.5
         
         # Remote work bonus
         location = job.get('location', '').lower()
-        if any(term in location for term in ['remote', 'work from home', 'anywhere']):
+        if self._remote_re.search(location):
             score += 1.0
         
         # LinkedIn-specific bonuses
@@ -272,10 +295,8 @@ class LinkedInSearchAgent(SearchAgentBase):
 
     def _is_valid_linkedin_result(self, result: Dict[str, Any]) -> bool:
         """Check if result is valid for LinkedIn"""
-        required_fields = ['title', 'company', 'url']
-        
         # Check required fields
-        if not all(result.get(field) for field in required_fields):
+        if not all(result.get(field) for field in self._required_fields):
             return False
         
         # Check if URL is LinkedIn
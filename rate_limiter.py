@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter - Token bucket rate limiting for outbound platform requests
+Part of the asynchronous multi-agent job search system
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+class TokenBucketRateLimiter:
+    """Async token bucket allowing bursts up to `capacity` requests, refilled at `rate` per second
+
+    Each acquire reserves its token immediately and sleeps only for as long as
+    the bucket is overdrawn, so callers are served in arrival order without a
+    lock and concurrent requests only wait once the burst budget is spent.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+
+    async def acquire(self, tokens: float = 1.0):
+        """Take tokens from the bucket, waiting until they have been refilled if necessary"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+        self._tokens -= tokens
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
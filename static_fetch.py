@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Static Fetch - Shared plumbing for fetching job pages without a browser
+Part of the asynchronous multi-agent job search system
+"""
+
+try:
+    import httpx
+    from bs4 import BeautifulSoup
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+    BeautifulSoup = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    HTMLParser = None
+
+# Desktop browser headers for the static (no browser) fetch path
+STATIC_FETCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+def create_http_client() -> 'httpx.AsyncClient':
+    """Keep-alive client for static fetches, HTTP/2 when h2 is installed"""
+    if not HTTPX_AVAILABLE:
+        raise ImportError("httpx and beautifulsoup4 are required for static fetches. Install with: pip install httpx beautifulsoup4")
+
+    # httpx advertises gzip, and brotli when its decoder is installed, on its own
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        headers=STATIC_FETCH_HEADERS,
+        timeout=10,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=32)
+    )
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests that retried LinkedIn extractions resume from the jobs already extracted
+Part of the asynchronous multi-agent job search system
+"""
+
+import contextlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import linkedin_extraction_agent
+from extraction_coordinator import ExtractionCoordinator
+from linkedin_extraction_agent import LinkedInExtractionAgent
+
+JOB_URLS = [
+    'https://www.linkedin.com/jobs/view/1001',
+    'https://www.linkedin.com/jobs/view/1002'
+]
+
+# What READ_JOB_ELEMENTS_JS returns for a fully rendered job page
+JOB_ELEMENTS = {
+    'title': 'Senior Drupal Developer',
+    'company': 'Acme Digital',
+    'location': 'Remote',
+    'description': 'Build and maintain Drupal 10 sites with PHP and MySQL.',
+    'insights': ['Contract'],
+    'posted_datetimes': ['2024-01-01'],
+    'posted_text': '',
+    'applicant_count': ''
+}
+
+class FakeResponse:
+    status = 200
+
+class FakePage:
+    def __init__(self, fail: bool):
+        self.fail = fail
+
+    async def route(self, pattern, handler):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+    async def goto(self, url, **kwargs):
+        if self.fail:
+            raise RuntimeError(f"Navigation to {url} timed out")
+        return FakeResponse()
+
+    async def wait_for_selector(self, selector, **kwargs):
+        pass
+
+    async def evaluate(self, script, arg=None):
+        return dict(JOB_ELEMENTS)
+
+class FakeBrowserPool:
+    """Browser pool double recording every page opened; URLs in failing_urls fail to load"""
+
+    def __init__(self):
+        self.browsers = {}
+        self.opened_urls = []
+        self.failing_urls = set()
+        self.max_pages_per_browser = 3
+
+    async def acquire_browser(self, domain_restrictions=None):
+        self.browsers['browser-1'] = object()
+        return 'browser-1'
+
+    async def release_browser(self, browser_id):
+        self.browsers.pop(browser_id, None)
+
+    @contextlib.asynccontextmanager
+    async def get_page(self, url, domain_restrictions=None, browser_id=None):
+        self.opened_urls.append(url)
+        yield FakePage(url in self.failing_urls)
+
+class ExtractionResumeTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+
+        # Keep the extraction on the fake browser: no static fetch and no gate wait
+        for patcher in (
+            mock.patch.object(linkedin_extraction_agent, 'HTTPX_AVAILABLE', False),
+            mock.patch.object(LinkedInExtractionAgent, '_handle_linkedin_gates', mock.AsyncMock())
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.browser_pool = FakeBrowserPool()
+
+    def _create_coordinator(self) -> ExtractionCoordinator:
+        return ExtractionCoordinator(browser_pool=self.browser_pool, cache_dir=self.cache_dir.name)
+
+    async def test_retried_batch_skips_extracted_jobs(self):
+        coordinator = self._create_coordinator()
+
+        # First attempt: the second job's page fails to load
+        self.browser_pool.failing_urls.add(JOB_URLS[1])
+        first = await coordinator.extract_jobs(JOB_URLS)
+        self.assertEqual(first['successful_extractions'], 1)
+        self.assertEqual(first['failed_extractions'], 1)
+
+        # Retry: only the job that failed is loaded again
+        self.browser_pool.failing_urls.clear()
+        self.browser_pool.opened_urls.clear()
+        second = await coordinator.extract_jobs(JOB_URLS)
+        self.assertEqual(second['successful_extractions'], 2)
+        self.assertEqual(self.browser_pool.opened_urls, [JOB_URLS[1]])
+
+    async def test_new_coordinator_resumes_from_cache_dir(self):
+        await self._create_coordinator().extract_jobs(JOB_URLS[:1])
+
+        # A restarted run reuses the job extracted before the restart
+        self.browser_pool.opened_urls.clear()
+        coordinator = self._create_coordinator()
+        result = await coordinator.extraction_agents['linkedin'].process_task(
+            coordinator._create_extraction_task('linkedin', JOB_URLS[0])
+        )
+        self.assertTrue(result['extraction_successful'])
+        self.assertTrue(result['from_cache'])
+        self.assertEqual(result['job_data']['title'], JOB_ELEMENTS['title'])
+        self.assertEqual(self.browser_pool.opened_urls, [])
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir.name, 'linkedin_extraction_cache.db')))
+
+    def test_cache_dir_none_disables_linkedin_cache(self):
+        coordinator = ExtractionCoordinator(browser_pool=self.browser_pool, cache_dir=None)
+        self.assertIsNone(coordinator.extraction_agents['linkedin'].cache)
+
+if __name__ == "__main__":
+    unittest.main()